@@ -13,6 +13,7 @@ from timeline_generator.models import (
     ThemeName,
     OutputFormat,
     QuickMilestone,
+    is_hex_color,
 )
 
 
@@ -51,6 +52,12 @@ class TestMilestone:
         m = Milestone(date="2024-01-15", title="Test")
         assert m.date == datetime(2024, 1, 15)
 
+    def test_non_iso_date_string_parsing(self):
+        """Test that non-ISO date strings fall back to dateutil."""
+        m = Milestone(date="Jan 15, 2024", title="Test", end_date="2024-02-01T09:30:00")
+        assert m.date == datetime(2024, 1, 15)
+        assert m.end_date == datetime(2024, 2, 1, 9, 30)
+
     def test_end_date_validation(self):
         """Test that end_date must be after start date."""
         with pytest.raises(ValueError):
@@ -87,6 +94,13 @@ class TestColorConfig:
         with pytest.raises(ValueError):
             ColorConfig(accent="invalid")
 
+    def test_color_with_trailing_newline_rejected(self):
+        """Test that a valid color followed by a newline is rejected."""
+        assert is_hex_color("#FFFFFF")
+        assert not is_hex_color("#FFFFFF\n")
+        with pytest.raises(ValueError):
+            ColorConfig(accent="#FFFFFF\n")
+
 
 class TestOutputConfig:
     """Tests for the OutputConfig model."""
@@ -143,6 +157,13 @@ class TestTimelineConfig:
         assert start == datetime(2024, 1, 15)
         assert end == datetime(2024, 12, 1)
 
+    def test_date_range_includes_end_dates(self, gantt_milestones):
+        """Test that duration end dates extend the date range."""
+        config = TimelineConfig(milestones=gantt_milestones)
+        start, end = config.date_range
+        assert start == datetime(2024, 1, 1)
+        assert end == datetime(2024, 7, 31)
+
     def test_unique_categories(self, gantt_milestones):
         """Test unique categories extraction."""
         config = TimelineConfig(milestones=gantt_milestones)
@@ -151,6 +172,13 @@ class TestTimelineConfig:
         assert "development" in cats
         assert "testing" in cats
 
+    def test_to_soa(self, gantt_milestones):
+        """Test struct-of-arrays conversion of milestones."""
+        config = TimelineConfig(milestones=gantt_milestones)
+        columns = config.to_soa()
+        assert columns.dates == [m.date for m in config.milestones]
+        assert columns.category_ids == [0, 1, 2]
+
     def test_custom_colors(self, sample_milestones):
         """Test config with custom colors."""
         config = TimelineConfig(
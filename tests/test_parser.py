@@ -6,6 +6,7 @@ from timeline_generator.parser import (
     parse_yaml,
     parse_json,
     parse_toon,
+    parse_file,
     parse_quick_milestones,
     create_config_from_quick,
     ParserError,
@@ -35,6 +36,15 @@ milestones:
         assert len(config.milestones) == 1
         assert config.milestones[0].title == "Start"
 
+    def test_parse_large_yaml_file_mapped(self, sample_yaml_config, tmp_path, monkeypatch):
+        """Test that YAML files over the threshold parse from a memory map."""
+        monkeypatch.setattr("timeline_generator.parser.MMAP_THRESHOLD", 0)
+        path = tmp_path / "timeline.yaml"
+        path.write_text(sample_yaml_config, encoding="utf-8")
+        config = parse_file(path)
+        assert config.title == "Test Timeline"
+        assert len(config.milestones) == 2
+
     def test_parse_invalid_yaml(self):
         """Test that invalid YAML raises ParserError."""
         with pytest.raises(ParserError):
@@ -79,11 +89,51 @@ class TestJSONParser:
         assert config.title == "Test Timeline"
         assert len(config.milestones) == 2
 
+    def test_parse_json_bytes(self, sample_json_config):
+        """Test parsing UTF-8 encoded JSON bytes."""
+        config = parse_json(sample_json_config.encode("utf-8"))
+        assert config.title == "Test Timeline"
+        assert len(config.milestones) == 2
+
+    def test_parse_file_unknown_extension_json(self, sample_json_config, tmp_path):
+        """Test that JSON content is detected in files without a known extension."""
+        path = tmp_path / "timeline.cfg"
+        path.write_text(sample_json_config, encoding="utf-8")
+        config = parse_file(path)
+        assert config.title == "Test Timeline"
+        assert len(config.milestones) == 2
+
+    def test_parse_file_unknown_extension_toon(self, tmp_path):
+        """Test that TOON content is detected in files without a known extension."""
+        path = tmp_path / "timeline.txt"
+        path.write_text("title: Sniffed\nmilestones[1]: date title\n2024-01-01 Start\n", encoding="utf-8")
+        config = parse_file(path)
+        assert config.title == "Sniffed"
+        assert config.milestones[0].title == "Start"
+
     def test_parse_invalid_json(self):
         """Test that invalid JSON raises ParserError."""
         with pytest.raises(ParserError):
             parse_json("{invalid json}")
 
+    def test_parse_invalid_json_message(self):
+        """Test that malformed JSON is reported with a single 'Invalid JSON' prefix."""
+        with pytest.raises(ParserError) as exc_info:
+            parse_json("{invalid json}")
+        assert str(exc_info.value) == "Invalid JSON: key must be a string at line 1 column 2"
+
+    def test_parse_json_non_object_root(self):
+        """Test that a non-object JSON root raises ParserError."""
+        with pytest.raises(ParserError, match="object at the root level"):
+            parse_json('[{"date": "2024-01-01", "title": "Start"}]')
+
+    def test_parse_json_validation_error(self):
+        """Test that schema errors are reported per field."""
+        with pytest.raises(ParserError) as exc_info:
+            parse_json('{"milestones": [{"date": "2024-01-01", "title": "Start", "color": "red"}]}')
+        assert exc_info.value.details
+        assert "milestones -> 0 -> color" in exc_info.value.details[0]
+
 
 class TestTOONParser:
     """Tests for TOON (Token-Oriented Object Notation) parsing."""
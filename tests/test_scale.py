@@ -8,6 +8,7 @@ from timeline_generator.core.scale import (
     ScaleInfo,
     calculate_scale,
     date_to_position,
+    dates_to_positions,
 )
 
 
@@ -134,6 +135,19 @@ class TestDateToPosition:
         # Positions should be increasing
         assert pos_q1 < pos_q2 < pos_q3
 
+    def test_batch_matches_single(self):
+        """Test that batch conversion matches per-date conversion."""
+        start = datetime(2024, 1, 1)
+        end = datetime(2024, 12, 31)
+        dates = [datetime(2024, 3, 15), datetime(2024, 6, 1), datetime(2024, 11, 20)]
+        
+        scale_info = calculate_scale(start, end, TimeScale.MONTHLY)
+        
+        positions = dates_to_positions(dates, scale_info, 1000, offset=50)
+        expected = [date_to_position(d, scale_info, 1000) + 50 for d in dates]
+        
+        assert positions == pytest.approx(expected)
+
 
 class TestScaleMarkers:
     """Tests for scale markers (ticks and labels)."""
@@ -1,5 +1,6 @@
 """Command-line interface for Timeline Generator."""
 
+import functools
 from pathlib import Path
 from typing import Optional, List
 
@@ -12,14 +13,8 @@ from rich.panel import Panel
 from . import __version__
 from .models import TimelineStyle, ThemeName, TimeScale, OutputFormat, TimelineConfig
 from .parser import parse_file, parse_quick_milestones, create_config_from_quick, ParserError
-from .themes import THEMES
-from .renderers import (
-    HorizontalRenderer,
-    VerticalRenderer,
-    GanttRenderer,
-    RoadmapRenderer,
-    InfographicRenderer,
-)
+from .themes import THEME_NAMES, get_theme_class
+from .renderers import get_renderer_class
 from .output.image import ImageExporter
 from .output.video import VideoExporter
 
@@ -34,24 +29,17 @@ console = Console()
 
 def get_renderer(config: TimelineConfig, theme):
     """Get the appropriate renderer for the timeline style."""
-    style = config.style
-    
-    renderers = {
-        TimelineStyle.HORIZONTAL: HorizontalRenderer,
-        TimelineStyle.VERTICAL: VerticalRenderer,
-        TimelineStyle.GANTT: GanttRenderer,
-        TimelineStyle.ROADMAP: RoadmapRenderer,
-        TimelineStyle.INFOGRAPHIC: InfographicRenderer,
-    }
-    
-    renderer_class = renderers.get(style, HorizontalRenderer)
-    return renderer_class(config, theme)
+    return get_renderer_class(config.style.value)(config, theme)
 
 
+@functools.lru_cache(maxsize=len(THEME_NAMES))
 def get_theme(name: str):
-    """Get a theme instance by name."""
-    theme_class = THEMES.get(name, THEMES["minimal"])
-    return theme_class()
+    """Get the shared theme instance for a name.
+    
+    Callers must not mutate the returned instance; use
+    ``Theme.with_color_overrides`` for custom colors.
+    """
+    return get_theme_class(name)()
 
 
 @app.command()
@@ -163,9 +151,8 @@ def generate(
         # Get theme and renderer
         theme_instance = get_theme(config.theme.value)
         
-        # Apply custom color overrides from config
-        if config.colors:
-            theme_instance.apply_color_overrides(config.colors)
+        # Apply custom color overrides from config (on a copy; themes are shared)
+        theme_instance = theme_instance.with_color_overrides(config.colors)
         
         renderer = get_renderer(config, theme_instance)
         
@@ -328,9 +315,8 @@ def quick(
         # Get theme and renderer
         theme_instance = get_theme(config.theme.value)
         
-        # Apply custom color overrides
-        if config.colors:
-            theme_instance.apply_color_overrides(config.colors)
+        # Apply custom color overrides (on a copy; themes are shared)
+        theme_instance = theme_instance.with_color_overrides(config.colors)
         
         renderer = get_renderer(config, theme_instance)
         
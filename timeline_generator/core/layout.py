@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional, List
 
 from ..models import Milestone, TimelineConfig
-from .scale import ScaleInfo, date_to_position
+from .scale import ScaleInfo, date_to_position, dates_to_positions
 
 
 @dataclass
@@ -109,6 +109,7 @@ class LayoutEngine:
         self.scale_info = scale_info
         self.width = width
         self.height = height
+        self.columns = config.to_soa()
         
         # Margins and spacing
         self.margin = 40
@@ -345,15 +346,15 @@ class LayoutEngine:
         
         # First pass: calculate initial positions
         initial_layouts = []
-        x_positions = []
+        x_positions = dates_to_positions(
+            self.columns.dates,
+            self.scale_info,
+            timeline_width,
+            layout.timeline_area.x,
+        )
         
         for i, milestone in enumerate(self.config.milestones):
-            x_pos = date_to_position(
-                milestone.date,
-                self.scale_info,
-                timeline_width,
-            ) + layout.timeline_area.x
-            x_positions.append(x_pos)
+            x_pos = x_positions[i]
             
             is_above = i % 2 == 0
             
@@ -536,12 +537,15 @@ class LayoutEngine:
         
         initial_layouts = []
         
+        y_positions = dates_to_positions(
+            self.columns.dates,
+            self.scale_info,
+            timeline_height,
+            layout.timeline_area.y,
+        )
+        
         for i, milestone in enumerate(self.config.milestones):
-            y_pos = date_to_position(
-                milestone.date,
-                self.scale_info,
-                timeline_height,
-            ) + layout.timeline_area.y
+            y_pos = y_positions[i]
             
             is_left = i % 2 == 0
             
@@ -645,15 +649,18 @@ class LayoutEngine:
         num_milestones = len(self.config.milestones)
         row_height = min(50, max(30, timeline_height / max(1, num_milestones)))
         
+        start_xs = dates_to_positions(
+            self.columns.dates,
+            self.scale_info,
+            chart_width,
+            chart_left,
+        )
+        
         for i, milestone in enumerate(self.config.milestones):
             row_y = timeline_top + i * row_height
             
             # Calculate bar position and width
-            start_x = date_to_position(
-                milestone.date,
-                self.scale_info,
-                chart_width,
-            ) + chart_left
+            start_x = start_xs[i]
             
             if milestone.end_date:
                 end_x = date_to_position(
@@ -787,51 +794,55 @@ class LayoutEngine:
             height=lanes_height,
         )
         
-        # Group milestones by category
-        category_map = {cat: i for i, cat in enumerate(categories)}
-        
         # Collect layouts by lane for optimization
         lane_layouts: dict[int, List[MilestoneLayout]] = {i: [] for i in range(num_lanes)}
         
-        for milestone in self.config.milestones:
-            cat = milestone.category or "default"
-            lane_idx = category_map.get(cat, 0)
+        # Card geometry is the same for every milestone
+        card_inset = 10  # Padding between card edge and its contents
+        desc_top_offset = card_inset + self.label_height + 4  # Description starts below the title
+        card_width = min(140, chart_width / max(3, len(self.config.milestones) / num_lanes))
+        card_height = lane_height - 2 * card_inset
+        inner_width = card_width - 2 * card_inset
+        desc_height = card_height - desc_top_offset - card_inset
+        show_descriptions = self.config.show_descriptions
+        
+        # X positions based on date
+        x_positions = dates_to_positions(
+            self.columns.dates,
+            self.scale_info,
+            chart_width,
+            chart_left,
+        )
+        
+        lane_ids = self.columns.category_ids
+        
+        for milestone, x_pos, lane_idx in zip(self.config.milestones, x_positions, lane_ids):
             lane_y = lanes_top + lane_idx * lane_height
             
-            # X position based on date
-            x_pos = date_to_position(
-                milestone.date,
-                self.scale_info,
-                chart_width,
-            ) + chart_left
-            
             # Card-like marker - use smaller cards if many milestones
-            card_width = min(140, chart_width / max(3, len(self.config.milestones) / num_lanes))
-            card_height = lane_height - 20
-            
             marker_pos = ElementPosition(
                 x=x_pos - card_width / 2,
-                y=lane_y + 10,
+                y=lane_y + card_inset,
                 width=card_width,
                 height=card_height,
             )
             
             # Label inside the card
             label_pos = ElementPosition(
-                x=marker_pos.x + 10,
-                y=marker_pos.y + 10,
-                width=card_width - 20,
-                height=24,
+                x=marker_pos.x + card_inset,
+                y=marker_pos.y + card_inset,
+                width=inner_width,
+                height=self.label_height,
             )
             
             # Description below title in card
             desc_pos = None
-            if self.config.show_descriptions and milestone.description:
+            if show_descriptions and milestone.description:
                 desc_pos = ElementPosition(
-                    x=marker_pos.x + 10,
-                    y=marker_pos.y + 38,
-                    width=card_width - 20,
-                    height=card_height - 48,
+                    x=marker_pos.x + card_inset,
+                    y=marker_pos.y + desc_top_offset,
+                    width=inner_width,
+                    height=desc_height,
                 )
             
             ml = MilestoneLayout(
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
 
 from dateutil.relativedelta import relativedelta
 
@@ -232,3 +232,32 @@ def date_to_position(
     date_seconds = (date - scale_info.start).total_seconds()
     return (date_seconds / total_seconds) * total_length
 
+
+def dates_to_positions(
+    dates: Iterable[datetime],
+    scale_info: ScaleInfo,
+    total_length: float,
+    offset: float = 0.0,
+) -> list[float]:
+    """
+    Convert many dates to timeline positions at once.
+    
+    Equivalent to calling date_to_position for each date and adding offset,
+    but the scale span is computed once for the whole batch.
+    
+    Args:
+        dates: The dates to convert.
+        scale_info: Scale information.
+        total_length: Total length of the timeline in pixels.
+        offset: Pixel offset added to every position (e.g. the axis start).
+        
+    Returns:
+        Positions in the same order as dates.
+    """
+    start = scale_info.start
+    total_seconds = (scale_info.end - start).total_seconds()
+    if total_seconds == 0:
+        return [total_length / 2 + offset for _ in dates]
+    
+    px_per_second = total_length / total_seconds
+    return [(d - start).total_seconds() * px_per_second + offset for d in dates]
@@ -22,6 +22,7 @@ Author: kbichave
 Repository: https://github.com/kbichave/timeline-generator-mcp
 """
 
+import sys
 from typing import Annotated
 
 from fastmcp import FastMCP
@@ -32,6 +33,7 @@ from .mcp.tools import (
     get_config_template_impl,
     list_styles_impl,
     list_themes_impl,
+    warmup,
 )
 
 
@@ -67,7 +69,7 @@ def generate_timeline(
     2024-06-01 Launch false
     ```
 
-    Returns: Base64-encoded image with metadata.
+    Returns: Base64-encoded image with metadata (raw SVG source for 'svg').
     """
     result = generate_timeline_impl(
         config_str=config,
@@ -76,6 +78,8 @@ def generate_timeline(
     )
     
     if result.success:
+        if result.svg_text is not None:
+            return f"{result.message}\n\n{result.svg_text}"
         return f"{result.message}\n\ndata:{result.mime_type};base64,{result.image_data}"
     else:
         return f"Error: {result.error}"
@@ -98,7 +102,7 @@ def quick_timeline(
     Example:
         quick_timeline(["2024-01-01:Start", "2024-06-01:Launch"])
 
-    Returns: Base64-encoded image with metadata.
+    Returns: Base64-encoded image with metadata (raw SVG source for 'svg').
     """
     result = quick_timeline_impl(
         milestones=milestones,
@@ -112,6 +116,8 @@ def quick_timeline(
     )
     
     if result.success:
+        if result.svg_text is not None:
+            return f"{result.message}\n\n{result.svg_text}"
         return f"{result.message}\n\ndata:{result.mime_type};base64,{result.image_data}"
     else:
         return f"Error: {result.error}"
@@ -164,6 +170,8 @@ def main():
     - Claude Desktop: timeline-mcp
     - uvx: uvx timeline-generator-mcp
     """
+    elapsed = warmup()
+    print(f"Timeline Generator warmed up in {elapsed * 1000:.0f} ms", file=sys.stderr)
     mcp.run()
 
 
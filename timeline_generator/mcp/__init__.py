@@ -11,6 +11,7 @@ from .tools import (
     get_config_template_impl,
     list_styles_impl,
     list_themes_impl,
+    warmup,
     TOON_TEMPLATES,
     YAML_TEMPLATES,
 )
@@ -21,6 +22,7 @@ __all__ = [
     "get_config_template_impl",
     "list_styles_impl",
     "list_themes_impl",
+    "warmup",
     "TOON_TEMPLATES",
     "YAML_TEMPLATES",
 ]
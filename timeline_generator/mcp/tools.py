@@ -9,26 +9,26 @@ Author: kbichave
 Repository: https://github.com/kbichave/timeline-generator-mcp
 """
 
-import base64
-import tempfile
+import binascii
+import functools
+import os
+import time
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Optional
 
-from ..models import TimelineStyle, ThemeName, OutputFormat, TimelineConfig
+from ..models import ThemeName, OutputFormat, TimelineConfig, ColorConfig, is_hex_color
 from ..parser import parse_yaml, parse_json, parse_toon, parse_quick_milestones, create_config_from_quick
-from ..themes import THEMES
-from ..renderers import (
-    HorizontalRenderer,
-    VerticalRenderer,
-    GanttRenderer,
-    RoadmapRenderer,
-    InfographicRenderer,
-)
+from ..themes import THEME_NAMES, get_theme_class
+from ..renderers import get_renderer_class
 from ..output.image import ImageExporter
 from ..output.video import VideoExporter
 
 
+# Reuse parsed configs when clients resend the same config string (e.g. to
+# change the output format). Opt-in via TIMELINE_PARSE_CACHE=1.
+PARSE_CACHE_ENABLED = os.environ.get("TIMELINE_PARSE_CACHE") == "1"
+
+
 # =============================================================================
 # Data Classes for Results
 # =============================================================================
@@ -39,6 +39,7 @@ class TimelineResult:
     success: bool
     message: str
     image_data: Optional[str] = None  # Base64-encoded
+    svg_text: Optional[str] = None  # Raw SVG source (SVG output only)
     mime_type: Optional[str] = None
     error: Optional[str] = None
 
@@ -49,21 +50,96 @@ class TimelineResult:
 
 def get_renderer(config: TimelineConfig, theme):
     """Get the appropriate renderer for the timeline style."""
-    renderers = {
-        TimelineStyle.HORIZONTAL: HorizontalRenderer,
-        TimelineStyle.VERTICAL: VerticalRenderer,
-        TimelineStyle.GANTT: GanttRenderer,
-        TimelineStyle.ROADMAP: RoadmapRenderer,
-        TimelineStyle.INFOGRAPHIC: InfographicRenderer,
-    }
-    renderer_class = renderers.get(config.style, HorizontalRenderer)
-    return renderer_class(config, theme)
+    return get_renderer_class(config.style.value)(config, theme)
+
+
+_OUTPUT_FORMATS = {
+    "png": OutputFormat.PNG,
+    "gif": OutputFormat.GIF,
+    "svg": OutputFormat.SVG,
+}
+
+_MIME_TYPES = {
+    "png": "image/png",
+    "gif": "image/gif",
+    "svg": "image/svg+xml",
+}
+
+
+_CONFIG_PARSERS = {
+    "toon": parse_toon,
+    "yaml": parse_yaml,
+    "json": parse_json,
+}
 
 
+def _invalid_accent_color(accent_color: str) -> TimelineResult:
+    """Build the error result for an accent color that is not '#RRGGBB'."""
+    return TimelineResult(
+        success=False,
+        message="Invalid accent color",
+        error=f"'accent_color' must be a hex color like '#FF5733', got {accent_color!r}."
+    )
+
+
+def _parse_config(config_format: str, config_str: str) -> TimelineConfig:
+    """Parse a TOON, YAML, or JSON configuration string (YAML if unknown)."""
+    return _CONFIG_PARSERS.get(config_format, parse_yaml)(config_str)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_config_cached(config_format: str, config_str: str) -> TimelineConfig:
+    """Parse a configuration string, memoized on (format, source).
+    
+    The returned config is shared; callers must copy it before mutating.
+    """
+    return _parse_config(config_format, config_str)
+
+
+@functools.lru_cache(maxsize=len(THEME_NAMES))
 def get_theme(name: str):
-    """Get a theme instance by name."""
-    theme_class = THEMES.get(name, THEMES["minimal"])
-    return theme_class()
+    """Get the shared theme instance for a name.
+    
+    Themes are cached per name, so callers must not mutate the returned
+    instance; use ``Theme.with_color_overrides`` for custom colors.
+    """
+    return get_theme_class(name)()
+
+
+_WARMUP_TOON = """title: Warmup
+milestones[2]: date title
+2024-01-01 Start
+2024-06-01 End"""
+
+_WARMUP_YAML = """title: Warmup
+milestones:
+  - date: "2024-01-01"
+    title: Start
+"""
+
+
+def warmup() -> float:
+    """
+    Pay one-time startup costs before the first tool call arrives.
+    
+    Instantiates every theme, runs the TOON and YAML parsers, and renders a
+    tiny PNG so lazy imports, Pydantic validators and font lookups are ready.
+    
+    Returns:
+        Seconds spent warming up.
+        
+    Raises:
+        RuntimeError: If the warmup render fails, so a server does not start
+            serving a broken render path.
+    """
+    start = time.perf_counter()
+    for name in THEME_NAMES:
+        get_theme(name)
+    parse_yaml(_WARMUP_YAML)
+    result = generate_timeline_impl(_WARMUP_TOON, config_format="toon", output_format="png", width=400, height=200)
+    if not result.success:
+        raise RuntimeError(f"Warmup render failed: {result.error or result.message}")
+    return time.perf_counter() - start
 
 
 # =============================================================================
@@ -261,6 +337,28 @@ output:
 }
 
 
+def _build_config_template(style: str, fmt: str) -> str:
+    """Render the documented template text for a style and config format."""
+    if fmt == "toon":
+        template = TOON_TEMPLATES.get(style, TOON_TEMPLATES["horizontal"])
+        format_note = "TOON format (30-60% fewer tokens than JSON)"
+        code_type = ""
+    else:
+        template = YAML_TEMPLATES.get(style, YAML_TEMPLATES["horizontal"])
+        format_note = "YAML format"
+        code_type = "yaml"
+    
+    return f"**{style.title()} Timeline Template** ({format_note})\n\n```{code_type}\n{template}\n```\n\nUse with `generate_timeline` tool. Set format='{fmt}' parameter."
+
+
+# Every known style/format combination, rendered once at import
+_CONFIG_TEMPLATE_CACHE = {
+    (style, fmt): _build_config_template(style, fmt)
+    for style in TOON_TEMPLATES
+    for fmt in ("toon", "yaml")
+}
+
+
 # =============================================================================
 # Tool Implementations
 # =============================================================================
@@ -302,71 +400,65 @@ def generate_timeline_impl(
             error="'config' parameter is required. Provide a TOON, YAML, or JSON configuration string."
         )
     
+    if accent_color and not is_hex_color(accent_color):
+        return _invalid_accent_color(accent_color)
+    
     try:
         # Parse configuration based on format
-        if config_format == "json":
-            config = parse_json(config_str)
-        elif config_format == "toon":
-            config = parse_toon(config_str)
+        if PARSE_CACHE_ENABLED:
+            # Deep copy so the overrides below never touch the cached config
+            config = _parse_config_cached(config_format, config_str).model_copy(deep=True)
         else:
-            config = parse_yaml(config_str)
+            config = _parse_config(config_format, config_str)
         
-        # Apply overrides
-        config.output.format = OutputFormat(output_format)
-        if width:
-            config.output.width = width
-        if height:
-            config.output.height = height
-        if transparent:
-            config.output.transparent = transparent
-        if fps:
-            config.output.fps = fps
-        if duration:
-            config.output.duration = duration
+        # Apply overrides in a single copy of the output settings
+        updates = {k: v for k, v in (
+            ("width", width),
+            ("height", height),
+            ("transparent", transparent),
+            ("fps", fps),
+            ("duration", duration),
+        ) if v}
+        # Unknown names fall through to OutputFormat() for its error message
+        updates["format"] = _OUTPUT_FORMATS.get(output_format) or OutputFormat(output_format)
+        config.output = config.output.model_copy(update=updates)
         if text_wrap is not None:
             config.text_wrap = text_wrap
         
         # Get theme and apply custom colors
-        theme_instance = get_theme(config.theme.value)
-        if config.colors:
-            theme_instance.apply_color_overrides(config.colors)
         if accent_color:
-            from ..models import ColorConfig
-            if not config.colors:
-                config.colors = ColorConfig()
-            config.colors.accent = accent_color
-            theme_instance.apply_color_overrides(config.colors)
+            if config.colors:
+                config.colors.accent = accent_color
+            else:
+                config.colors = ColorConfig.model_construct(accent=accent_color)
+        theme_instance = get_theme(config.theme.value).with_color_overrides(config.colors)
         
         # Create renderer and generate
-        renderer = get_renderer(config, theme_instance)
-        
-        with tempfile.NamedTemporaryFile(suffix=f".{output_format}", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-        
-        if output_format in ("png", "svg"):
-            exporter = ImageExporter(renderer)
-            exporter.export(tmp_path, OutputFormat(output_format))
-        else:
-            exporter = VideoExporter(renderer)
-            exporter.export_gif(tmp_path, fps=fps, duration=duration)
-        
-        # Read and encode
-        with open(tmp_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
-        tmp_path.unlink()
-        
-        mime_type = {
-            "png": "image/png",
-            "gif": "image/gif",
-            "svg": "image/svg+xml"
-        }[output_format]
-        
-        return TimelineResult(
-            success=True,
-            message=f"Generated {output_format.upper()} timeline: '{config.title}' with {len(config.milestones)} milestones ({config.style.value} style, {config.theme.value} theme)",
-            image_data=image_data,
-            mime_type=mime_type,
-        )
+        with get_renderer(config, theme_instance) as renderer:
+            message = f"Generated {output_format.upper()} timeline: '{config.title}' with {len(config.milestones)} milestones ({config.style.value} style, {config.theme.value} theme)"
+            
+            # SVG is text: return the source as-is instead of base64 via a tempfile
+            if output_format == "svg":
+                return TimelineResult(
+                    success=True,
+                    message=message,
+                    svg_text=ImageExporter(renderer).export_bytes(OutputFormat.SVG).decode("utf-8"),
+                    mime_type=_MIME_TYPES["svg"],
+                )
+            
+            # Encode straight from memory; no tempfile round-trip
+            if output_format == "png":
+                data = ImageExporter(renderer).export_bytes(OutputFormat.PNG)
+            else:
+                data = VideoExporter(renderer).export_bytes(OutputFormat.GIF, fps=fps, duration=duration)
+            image_data = binascii.b2a_base64(data, newline=False).decode("ascii")
+            
+            return TimelineResult(
+                success=True,
+                message=message,
+                image_data=image_data,
+                mime_type=_MIME_TYPES[output_format],
+            )
     
     except Exception as e:
         return TimelineResult(
@@ -417,6 +509,9 @@ def quick_timeline_impl(
             error="'milestones' array is required. Format: ['2024-01-01:Title', '2024-06-01:Another Title']"
         )
     
+    if accent_color and not is_hex_color(accent_color):
+        return _invalid_accent_color(accent_color)
+    
     try:
         parsed_milestones = parse_quick_milestones(milestones)
         
@@ -434,41 +529,33 @@ def quick_timeline_impl(
         
         # Apply accent color if provided
         if accent_color:
-            from ..models import ColorConfig
-            config.colors = ColorConfig(accent=accent_color)
-        
-        theme_instance = get_theme(config.theme.value)
-        if config.colors:
-            theme_instance.apply_color_overrides(config.colors)
-        
-        renderer = get_renderer(config, theme_instance)
-        
-        with tempfile.NamedTemporaryFile(suffix=f".{output_format}", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-        
-        if output_format in ("png", "svg"):
-            exporter = ImageExporter(renderer)
-            exporter.export(tmp_path, OutputFormat(output_format))
-        else:
-            exporter = VideoExporter(renderer)
-            exporter.export_gif(tmp_path, fps=fps, duration=duration)
-        
-        with open(tmp_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("utf-8")
-        tmp_path.unlink()
+            config.colors = ColorConfig.model_construct(accent=accent_color)
         
-        mime_type = {
-            "png": "image/png",
-            "gif": "image/gif",
-            "svg": "image/svg+xml"
-        }[output_format]
+        theme_instance = get_theme(config.theme.value).with_color_overrides(config.colors)
         
-        return TimelineResult(
-            success=True,
-            message=f"Generated {style} timeline: '{title}' with {len(parsed_milestones)} milestones",
-            image_data=image_data,
-            mime_type=mime_type,
-        )
+        with get_renderer(config, theme_instance) as renderer:
+            message = f"Generated {style} timeline: '{title}' with {len(parsed_milestones)} milestones"
+            
+            if output_format == "svg":
+                return TimelineResult(
+                    success=True,
+                    message=message,
+                    svg_text=ImageExporter(renderer).export_bytes(OutputFormat.SVG).decode("utf-8"),
+                    mime_type=_MIME_TYPES["svg"],
+                )
+            
+            if output_format == "png":
+                data = ImageExporter(renderer).export_bytes(OutputFormat.PNG)
+            else:
+                data = VideoExporter(renderer).export_bytes(OutputFormat.GIF, fps=fps, duration=duration)
+            image_data = binascii.b2a_base64(data, newline=False).decode("ascii")
+            
+            return TimelineResult(
+                success=True,
+                message=message,
+                image_data=image_data,
+                mime_type=_MIME_TYPES[output_format],
+            )
     
     except Exception as e:
         return TimelineResult(
@@ -489,16 +576,10 @@ def get_config_template_impl(style: str = "horizontal", fmt: str = "toon") -> st
     Returns:
         Template string with documentation
     """
-    if fmt == "toon":
-        template = TOON_TEMPLATES.get(style, TOON_TEMPLATES["horizontal"])
-        format_note = "TOON format (30-60% fewer tokens than JSON)"
-        code_type = ""
-    else:
-        template = YAML_TEMPLATES.get(style, YAML_TEMPLATES["horizontal"])
-        format_note = "YAML format"
-        code_type = "yaml"
-    
-    return f"**{style.title()} Timeline Template** ({format_note})\n\n```{code_type}\n{template}\n```\n\nUse with `generate_timeline` tool. Set format='{fmt}' parameter."
+    cached = _CONFIG_TEMPLATE_CACHE.get((style, fmt))
+    if cached is not None:
+        return cached
+    return _build_config_template(style, fmt)
 
 
 def list_styles_impl() -> str:
@@ -15,6 +15,12 @@ Author: kbichave
 Repository: https://github.com/kbichave/timeline-generator-mcp
 """
 
+import asyncio
+import binascii
+import functools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from mcp.server import Server
@@ -27,6 +33,7 @@ from .mcp.tools import (
     get_config_template_impl,
     list_styles_impl,
     list_themes_impl,
+    warmup,
 )
 
 
@@ -36,6 +43,10 @@ from .mcp.tools import (
 
 server = Server("timeline-generator-mcp")
 
+# Rendering and encoding run here so they never block the event loop.
+# Bounded to the CPU count to cap memory from concurrent renders.
+_render_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+
 
 # =============================================================================
 # Tool Definitions
@@ -209,6 +220,21 @@ RETURNS: Formatted list of themes with color descriptions""",
 # Server Handlers
 # =============================================================================
 
+def _image_data(result) -> str:
+    """Get base64 image data for ImageContent (SVG results carry raw text)."""
+    # ImageContent.data is a base64 string in every MCP revision; there is no
+    # raw binary transport for tool results, so the encode cannot be skipped.
+    if result.svg_text is not None:
+        return binascii.b2a_base64(result.svg_text.encode("utf-8"), newline=False).decode("ascii")
+    return result.image_data
+
+
+async def _run_in_pool(func, **kwargs):
+    """Run a blocking tool implementation on the render thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_render_pool, functools.partial(func, **kwargs))
+
+
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """Return all available tools."""
@@ -220,7 +246,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
     """Route tool calls to appropriate handlers."""
     
     if name == "generate_timeline":
-        result = generate_timeline_impl(
+        result = await _run_in_pool(
+            generate_timeline_impl,
             config_str=arguments.get("config", ""),
             config_format=arguments.get("format", "toon"),
             output_format=arguments.get("output_format", "png"),
@@ -228,13 +255,14 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
         if result.success:
             return [
                 TextContent(type="text", text=result.message),
-                ImageContent(type="image", data=result.image_data, mimeType=result.mime_type),
+                ImageContent(type="image", data=_image_data(result), mimeType=result.mime_type),
             ]
         else:
             return [TextContent(type="text", text=result.error)]
     
     elif name == "quick_timeline":
-        result = quick_timeline_impl(
+        result = await _run_in_pool(
+            quick_timeline_impl,
             milestones=arguments.get("milestones", []),
             title=arguments.get("title", "Timeline"),
             style=arguments.get("style", "horizontal"),
@@ -246,7 +274,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
         if result.success:
             return [
                 TextContent(type="text", text=result.message),
-                ImageContent(type="image", data=result.image_data, mimeType=result.mime_type),
+                ImageContent(type="image", data=_image_data(result), mimeType=result.mime_type),
             ]
         else:
             return [TextContent(type="text", text=result.error)]
@@ -282,7 +310,8 @@ def main():
     This is the legacy entry point. For most use cases, use FastMCP instead:
         timeline-mcp (default)
     """
-    import asyncio
+    elapsed = warmup()
+    print(f"Timeline Generator warmed up in {elapsed * 1000:.0f} ms", file=sys.stderr)
     
     async def run_server():
         async with stdio_server() as (read_stream, write_stream):
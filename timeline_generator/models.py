@@ -1,12 +1,35 @@
 """Pydantic data models for timeline configuration and milestones."""
 
+import re
+import sys
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 from typing import Optional
 
+from dateutil.parser import parse as _dateparse
 from pydantic import BaseModel, Field, field_validator
 
 
+# '#RRGGBB' colors, as accepted by Milestone.color and ColorConfig
+HEX_COLOR_PATTERN = r"^#[0-9A-Fa-f]{6}$"
+_HEX_COLOR_RE = re.compile(HEX_COLOR_PATTERN)
+
+
+def is_hex_color(value: str) -> bool:
+    """Check that a whole string is a '#RRGGBB' color (no trailing newline)."""
+    return _HEX_COLOR_RE.fullmatch(value) is not None
+
+
+def parse_datetime(s: str) -> datetime:
+    """Parse a date string, trying the fast ISO 8601 parser before dateutil."""
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return _dateparse(s)
+
+
 class TimeScale(str, Enum):
     """Supported time scales for timeline display."""
     
@@ -53,7 +76,7 @@ class Milestone(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
     description: Optional[str] = Field(default=None, max_length=500)
     icon: Optional[str] = Field(default=None, description="Icon name or emoji")
-    color: Optional[str] = Field(default=None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    color: Optional[str] = Field(default=None, pattern=HEX_COLOR_PATTERN)
     highlight: bool = Field(default=False, description="Make this milestone stand out")
     category: Optional[str] = Field(default=None, max_length=50)
     badge: Optional[str] = Field(
@@ -76,29 +99,34 @@ class Milestone(BaseModel):
         if isinstance(v, datetime):
             return v
         if isinstance(v, str):
-            from dateutil.parser import parse
-            return parse(v)
+            return parse_datetime(v)
         raise ValueError(f"Cannot parse date: {v}")
 
     @field_validator("end_date")
     @classmethod
     def end_date_after_start(cls, v, info):
         """Ensure end_date is after date if provided."""
-        if v is not None and info.data.get("date") is not None:
-            if v < info.data["date"]:
-                raise ValueError("end_date must be after date")
+        d = info.data.get("date")
+        if v is not None and d is not None and v < d:
+            raise ValueError("end_date must be after date")
         return v
 
+    @field_validator("category")
+    @classmethod
+    def intern_category(cls, v):
+        """Intern category names so repeated categories share one string."""
+        return sys.intern(v) if v is not None else None
+
 
 class ColorConfig(BaseModel):
     """Custom color configuration to override theme colors."""
     
-    background: Optional[str] = Field(default=None, pattern=r"^#[0-9A-Fa-f]{6}$")
-    text: Optional[str] = Field(default=None, pattern=r"^#[0-9A-Fa-f]{6}$")
-    accent: Optional[str] = Field(default=None, pattern=r"^#[0-9A-Fa-f]{6}$")
-    secondary: Optional[str] = Field(default=None, pattern=r"^#[0-9A-Fa-f]{6}$")
-    highlight: Optional[str] = Field(default=None, pattern=r"^#[0-9A-Fa-f]{6}$")
-    axis: Optional[str] = Field(default=None, pattern=r"^#[0-9A-Fa-f]{6}$")
+    background: Optional[str] = Field(default=None, pattern=HEX_COLOR_PATTERN)
+    text: Optional[str] = Field(default=None, pattern=HEX_COLOR_PATTERN)
+    accent: Optional[str] = Field(default=None, pattern=HEX_COLOR_PATTERN)
+    secondary: Optional[str] = Field(default=None, pattern=HEX_COLOR_PATTERN)
+    highlight: Optional[str] = Field(default=None, pattern=HEX_COLOR_PATTERN)
+    axis: Optional[str] = Field(default=None, pattern=HEX_COLOR_PATTERN)
 
 
 class FontConfig(BaseModel):
@@ -125,6 +153,14 @@ class OutputConfig(BaseModel):
     )
 
 
+@dataclass
+class MilestoneColumns:
+    """Column-oriented (struct-of-arrays) view of a milestone list."""
+    
+    dates: list[datetime]
+    category_ids: list[int]  # Index into TimelineConfig.unique_categories
+
+
 class TimelineConfig(BaseModel):
     """Complete timeline configuration."""
     
@@ -162,7 +198,8 @@ class TimelineConfig(BaseModel):
     @classmethod
     def sort_milestones(cls, v):
         """Sort milestones by date."""
-        return sorted(v, key=lambda m: m.date)
+        v.sort(key=attrgetter("date"))
+        return v
     
     @property
     def date_range(self) -> tuple[datetime, datetime]:
@@ -170,23 +207,52 @@ class TimelineConfig(BaseModel):
         if not self.milestones:
             now = datetime.now()
             return now, now
-        dates = [m.date for m in self.milestones]
-        # Include end dates for duration milestones
+        lo = hi = self.milestones[0].date
         for m in self.milestones:
-            if m.end_date:
-                dates.append(m.end_date)
-        return min(dates), max(dates)
+            if m.date < lo:
+                lo = m.date
+            elif m.date > hi:
+                hi = m.date
+            # Include end dates for duration milestones (never before date)
+            if m.end_date is not None and m.end_date > hi:
+                hi = m.end_date
+        return lo, hi
     
     @property
     def unique_categories(self) -> list[str]:
         """Get all unique categories from milestones."""
         if self.categories:
             return self.categories
+        seen = set()
         cats = []
         for m in self.milestones:
-            if m.category and m.category not in cats:
-                cats.append(m.category)
+            c = m.category
+            if c and c not in seen:
+                seen.add(c)
+                cats.append(c)
         return cats if cats else ["default"]
+    
+    def to_soa(self) -> MilestoneColumns:
+        """
+        Convert milestones into the columns the layout engine reads.
+        
+        Milestones without a category (or with one not listed in the
+        configured categories) map to category id 0.
+        """
+        category_map = {cat: i for i, cat in enumerate(self.unique_categories)}
+        milestones = self.milestones
+        return MilestoneColumns(
+            dates=[m.date for m in milestones],
+            category_ids=[category_map.get(m.category or "default", 0) for m in milestones],
+        )
+
+
+def _split_quick(s: str) -> tuple[datetime, str]:
+    """Split a 'DATE:TITLE' string into its parsed date and stripped title."""
+    date_str, sep, title = s.partition(":")
+    if not sep:
+        raise ValueError(f"Invalid format: {s}. Expected 'DATE:TITLE'")
+    return parse_datetime(date_str), title.strip()
 
 
 class QuickMilestone(BaseModel):
@@ -198,11 +264,8 @@ class QuickMilestone(BaseModel):
     @classmethod
     def from_string(cls, s: str) -> "QuickMilestone":
         """Parse a string like '2024-01-01:Title' into a QuickMilestone."""
-        if ":" not in s:
-            raise ValueError(f"Invalid format: {s}. Expected 'DATE:TITLE'")
-        parts = s.split(":", 1)
-        from dateutil.parser import parse
-        return cls(date=parse(parts[0]), title=parts[1].strip())
+        date, title = _split_quick(s)
+        return cls(date=date, title=title)
     
     def to_milestone(self) -> Milestone:
         """Convert to a full Milestone object."""
@@ -1,7 +1,7 @@
 """Image export functionality (PNG, SVG)."""
 
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Union
 import io
 
 import cairo
@@ -42,9 +42,18 @@ class ImageExporter:
             Path to the saved file.
         """
         path = Path(output_path)
-        
+        self._save_png(path, quality, transparent)
+        return path
+    
+    def _save_png(
+        self,
+        target: Union[str, Path, BinaryIO],
+        quality: int,
+        transparent: bool,
+    ) -> None:
+        """Render the timeline and save it as PNG to a path or binary stream."""
         # Render the timeline
-        surface = self.renderer.render()
+        self.renderer.render()
         
         # Convert to PIL Image
         img = self.renderer.surface_to_pil()
@@ -53,18 +62,21 @@ class ImageExporter:
         if not transparent:
             # Ensure RGB mode for non-transparent
             if img.mode == "RGBA":
-                # Create white background
-                background = Image.new("RGB", img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[3])  # Use alpha as mask
-                img = background
+                alpha = img.getchannel("A")
+                if alpha.getextrema()[0] == 255:
+                    # Fully opaque: nothing to composite
+                    img = img.convert("RGB")
+                else:
+                    # Create white background
+                    background = Image.new("RGB", img.size, (255, 255, 255))
+                    background.paste(img, mask=alpha)  # Use alpha as mask
+                    img = background
         
         # Save with quality
         if transparent and img.mode == "RGBA":
-            img.save(path, "PNG", optimize=True)
+            img.save(target, "PNG", optimize=True)
         else:
-            img.save(path, "PNG", quality=quality, optimize=True)
-        
-        return path
+            img.save(target, "PNG", quality=quality, optimize=True)
     
     def export_svg(self, output_path: Union[str, Path]) -> Path:
         """
@@ -77,31 +89,16 @@ class ImageExporter:
             Path to the saved file.
         """
         path = Path(output_path)
+        self._save_svg(str(path))
+        return path
+    
+    def _save_svg(self, target: Union[str, BinaryIO]) -> None:
+        """Render the timeline as SVG to a path or binary stream."""
+        svg_surface = cairo.SVGSurface(target, self.config.output.width, self.config.output.height)
         
-        # Create SVG surface
-        width = self.config.output.width
-        height = self.config.output.height
-        
-        svg_surface = cairo.SVGSurface(str(path), width, height)
-        
-        # Create new context with SVG surface
-        old_surface = self.renderer._surface
-        old_ctx = self.renderer._ctx
-        
-        self.renderer._surface = svg_surface
-        self.renderer._ctx = cairo.Context(svg_surface)
-        
-        # Render to SVG
-        self.renderer.render()
-        
-        # Finish and close
+        # Render to SVG, then finish and close
+        self.renderer.render_to(svg_surface)
         svg_surface.finish()
-        
-        # Restore original surface
-        self.renderer._surface = old_surface
-        self.renderer._ctx = old_ctx
-        
-        return path
     
     def export_bytes(self, format: OutputFormat = OutputFormat.PNG) -> bytes:
         """
@@ -116,28 +113,17 @@ class ImageExporter:
         if format == OutputFormat.SVG:
             # SVG to bytes
             buffer = io.BytesIO()
-            width = self.config.output.width
-            height = self.config.output.height
-            
-            svg_surface = cairo.SVGSurface(buffer, width, height)
-            
-            old_surface = self.renderer._surface
-            old_ctx = self.renderer._ctx
-            
-            self.renderer._surface = svg_surface
-            self.renderer._ctx = cairo.Context(svg_surface)
-            
-            self.renderer.render()
-            svg_surface.finish()
-            
-            self.renderer._surface = old_surface
-            self.renderer._ctx = old_ctx
-            
+            self._save_svg(buffer)
             return buffer.getvalue()
         else:
-            # PNG to bytes
-            self.renderer.render()
-            return self.renderer.surface_to_bytes("png")
+            # PNG to bytes, with the same background handling as export_png
+            buffer = io.BytesIO()
+            self._save_png(
+                buffer,
+                quality=self.config.output.quality,
+                transparent=self.config.output.transparent,
+            )
+            return buffer.getvalue()
     
     def export(
         self,
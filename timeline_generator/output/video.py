@@ -1,28 +1,151 @@
 """Video/GIF export functionality."""
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, List
+from typing import BinaryIO, Iterator, Optional, Sequence, Union, List
+import io
+import multiprocessing
 import tempfile
 import os
+import shutil
+import subprocess
+import sys
+import threading
 
 from PIL import Image
 
 from ..models import TimelineConfig, OutputFormat
 from ..renderers.base import BaseRenderer
+from ..themes.base import Theme
+
+
+# Below this many frames, process startup costs more than it saves
+MIN_PARALLEL_FRAMES = 32
+
+# Frames per task sent to a worker process when rendering in parallel
+PARALLEL_CHUNK_FRAMES = 8
+
+# Post-process GIFs with the gifsicle binary (smaller files, more CPU).
+# Opt-in via TIMELINE_GIFSICLE=1; skipped if gifsicle is not on PATH.
+GIFSICLE_ENABLED = os.environ.get("TIMELINE_GIFSICLE") == "1"
+
+# Alpha-to-mask lookup for GIF transparency: mostly transparent pixels
+# (alpha <= 128) map to the transparent palette index
+_GIF_TRANSPARENT_LUT = [255 if a <= 128 else 0 for a in range(256)]
+
+# Scratch directory for encoders that can only write to a path. On Linux,
+# /dev/shm is tmpfs, so the write and read-back never reach a block device.
+_TMP_DIR = "/dev/shm" if sys.platform.startswith("linux") and os.path.isdir("/dev/shm") else None
+
+
+# Frame-rendering worker processes, started on first use and kept for the
+# life of the process so repeated exports skip pool startup. The pool is
+# created lazily from server threads, and forking a multi-threaded process
+# can deadlock, so workers are started by a fork server (or spawned).
+_frame_pool: Optional[ProcessPoolExecutor] = None
+_frame_pool_lock = threading.Lock()
+
+
+def _get_frame_pool() -> ProcessPoolExecutor:
+    """Return the shared frame-rendering process pool."""
+    global _frame_pool
+    with _frame_pool_lock:
+        if _frame_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _frame_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=context)
+        return _frame_pool
+
+
+@lru_cache(maxsize=32)
+def _progress_schedule(num_frames: int, hold_frames: int) -> tuple[float, ...]:
+    """
+    Compute the eased progress value for every frame of an animation.
+    
+    Holds at 0.0 for the first hold_frames and at 1.0 for the last
+    hold_frames, with a cubic ease-out in between. Exports with the same
+    frame count share one cached schedule.
+    """
+    total_animation_frames = num_frames - (hold_frames * 2)
+    span = max(1, total_animation_frames - 1)
+    last_anim = num_frames - hold_frames
+    return tuple(
+        0.0 if i < hold_frames
+        else 1.0 if i >= last_anim
+        else 1 - (1 - (i - hold_frames) / span) ** 3
+        for i in range(num_frames)
+    )
+
+
+def _find_ffmpeg() -> Optional[str]:
+    """Locate an ffmpeg binary: on PATH, else the one bundled for moviepy."""
+    exe = shutil.which("ffmpeg")
+    if exe:
+        return exe
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        return None
+
+
+def _gifsicle_optimize(data: bytes) -> bytes:
+    """Run GIF bytes through gifsicle -O3, returning the input on any failure."""
+    exe = shutil.which("gifsicle")
+    if exe is None:
+        return data
+    try:
+        result = subprocess.run(
+            [exe, "-O3", "--no-warnings"],
+            input=data,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return data
+    return result.stdout or data
+
+
+def _render_frame_chunk(
+    renderer_class: type,
+    config: TimelineConfig,
+    theme: Theme,
+    progresses: Sequence[float],
+) -> List[Image.Image]:
+    """Render a contiguous run of frames in a worker process."""
+    renderer = renderer_class(config, theme)
+    frames = []
+    previous = None
+    for progress in progresses:
+        # Hold frames repeat a progress value; reuse the rendered image
+        if frames and progress == previous:
+            frames.append(frames[-1])
+            continue
+        renderer.render_frame(progress)
+        frames.append(renderer.surface_to_pil())
+        previous = progress
+    return frames
 
 
 class VideoExporter:
     """Export timelines as animated GIFs or videos."""
     
-    def __init__(self, renderer: BaseRenderer):
+    def __init__(self, renderer: BaseRenderer, max_workers: Optional[int] = 1):
         """
         Initialize the video exporter.
         
         Args:
             renderer: The renderer to use for generating frames.
+            max_workers: Processes used to render frames. The default, 1,
+                renders serially in this process: frames are cheap to render
+                but large to send back from workers. None uses the CPU count.
         """
         self.renderer = renderer
         self.config = renderer.config
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
     
     def generate_frames(
         self,
@@ -39,44 +162,120 @@ class VideoExporter:
         Returns:
             List of PIL Images for each frame.
         """
+        return list(self.iter_frames(num_frames, include_hold_frames))
+    
+    def iter_frames(
+        self,
+        num_frames: int = None,
+        include_hold_frames: bool = True,
+    ) -> Iterator[Image.Image]:
+        """
+        Generate animation frames one at a time, in order.
+        
+        Serial rendering holds only the current frame in memory, and parallel
+        rendering only a few short runs of frames, which lets streaming
+        encoders consume frames as they are produced. Consecutive
+        frames with the same progress (the hold frames) are rendered once and
+        yielded as the same Image object.
+        
+        Args:
+            num_frames: Number of frames to generate. If None, calculated from config.
+            include_hold_frames: Add extra frames at start and end for pause effect.
+            
+        Yields:
+            A PIL Image for each frame.
+        """
+        progresses, workers = self._frame_schedule(num_frames, include_hold_frames)
+        if workers > 1:
+            yield from self._iter_frames_parallel(progresses, workers)
+            return
+        
+        frame = None
+        previous = None
+        for progress in progresses:
+            # Render frame (hold frames repeat the previous one)
+            if frame is None or progress != previous:
+                self.renderer.render_frame(progress)
+                frame = self.renderer.surface_to_pil()
+                previous = progress
+            yield frame
+    
+    def _iter_raw_frames(
+        self,
+        num_frames: int = None,
+        include_hold_frames: bool = True,
+    ) -> Iterator[Union[bytes, memoryview]]:
+        """
+        Generate frames as raw BGRA pixel buffers, in order.
+        
+        Serially rendered frames are yielded as a view of the Cairo surface
+        itself (valid until the next frame is requested), so no PIL image or
+        channel swizzle is involved.
+        """
+        progresses, workers = self._frame_schedule(num_frames, include_hold_frames)
+        if workers > 1:
+            for frame in self._iter_frames_parallel(progresses, workers):
+                yield frame.tobytes("raw", "BGRA")
+            return
+        
+        surface = None
+        previous = None
+        for progress in progresses:
+            if surface is None or progress != previous:
+                surface = self.renderer.render_frame(progress)
+                surface.flush()
+                previous = progress
+            yield surface.get_data()
+    
+    def _frame_schedule(
+        self,
+        num_frames: Optional[int],
+        include_hold_frames: bool,
+    ) -> tuple[Sequence[float], int]:
+        """Get per-frame progress values and the worker count (1 = serial)."""
         if num_frames is None:
             # Calculate based on config
             fps = self.config.output.fps
             duration = self.config.output.duration
             num_frames = int(fps * duration)
         
-        frames = []
-        
-        # Hold frames at the start (show title only)
+        # Hold frames at the start (title only) and end (full content)
         hold_frames = 10 if include_hold_frames else 0
+        progresses = _progress_schedule(num_frames, hold_frames)
         
-        # Generate animation frames
-        total_animation_frames = num_frames - (hold_frames * 2)
-        
-        for i in range(num_frames):
-            if i < hold_frames:
-                # Initial hold - minimal content
-                progress = 0.0
-            elif i >= num_frames - hold_frames:
-                # Final hold - full content
-                progress = 1.0
-            else:
-                # Animation progress
-                anim_frame = i - hold_frames
-                progress = anim_frame / max(1, total_animation_frames - 1)
-                # Apply easing
-                progress = self._ease_out_cubic(progress)
-            
-            # Render frame
-            surface = self.renderer.render_frame(progress)
-            frame = self.renderer.surface_to_pil()
-            frames.append(frame)
-        
-        return frames
+        workers = min(self.max_workers, num_frames)
+        if workers > 1 and num_frames >= MIN_PARALLEL_FRAMES:
+            return progresses, workers
+        return progresses, 1
     
-    def _ease_out_cubic(self, t: float) -> float:
-        """Cubic ease-out function for smooth animation."""
-        return 1 - pow(1 - t, 3)
+    def _iter_frames_parallel(self, progresses: Sequence[float], workers: int) -> Iterator[Image.Image]:
+        """Render frames across the shared process pool, yielding them in order.
+        
+        Frames are independent given their progress value, so each worker
+        builds its own renderer (Cairo surfaces are not picklable) and renders
+        a short run of frames. Only a couple of runs per worker are in flight
+        at once, so finished frames are not all held in memory.
+        """
+        pool = _get_frame_pool()
+        renderer_class = type(self.renderer)
+        pending = deque()
+        try:
+            for start in range(0, len(progresses), PARALLEL_CHUNK_FRAMES):
+                pending.append(pool.submit(
+                    _render_frame_chunk,
+                    renderer_class,
+                    self.config,
+                    self.renderer.theme,
+                    progresses[start:start + PARALLEL_CHUNK_FRAMES],
+                ))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Consumer stopped early (or a chunk failed): drop queued work
+            for future in pending:
+                future.cancel()
     
     def export_gif(
         self,
@@ -100,7 +299,59 @@ class VideoExporter:
             Path to the saved file.
         """
         path = Path(output_path)
+        self._write_gif(path, fps, duration, loop, optimize)
+        return path
+    
+    def export_bytes(
+        self,
+        format: OutputFormat = OutputFormat.GIF,
+        fps: int = None,
+        duration: float = None,
+    ) -> bytes:
+        """
+        Export the animation as bytes.
         
+        Args:
+            format: Output format (GIF or MP4).
+            fps: Frames per second. If None, uses config value.
+            duration: Total duration in seconds. If None, uses config value.
+            
+        Returns:
+            Animation data as bytes.
+        """
+        if format == OutputFormat.MP4:
+            # export_mp4 would fall back to writing a GIF file beside the
+            # scratch path, which nobody would collect here
+            if _find_ffmpeg() is None:
+                raise RuntimeError(
+                    "ffmpeg not available for MP4 export. "
+                    "Install moviepy (which bundles ffmpeg) with: pip install moviepy"
+                )
+            
+            # The MP4 encoder needs a real path (on tmpfs where available).
+            # The handle is closed before ffmpeg opens the file, which
+            # Windows requires, and the file is removed explicitly.
+            with tempfile.NamedTemporaryFile(suffix=".mp4", dir=_TMP_DIR, delete=False) as tmp:
+                path = Path(tmp.name)
+            try:
+                self.export_mp4(path, fps, duration)
+                return path.read_bytes()
+            finally:
+                path.unlink(missing_ok=True)
+        
+        buffer = io.BytesIO()
+        self._write_gif(buffer, fps, duration)
+        return buffer.getvalue()
+    
+    def _write_gif(
+        self,
+        target: Union[str, Path, BinaryIO],
+        fps: int = None,
+        duration: float = None,
+        loop: int = 0,
+        optimize: bool = True,
+    ) -> None:
+        """Render the animation and write it as GIF to a path or binary stream."""
         # Use config values if not provided
         if fps is None:
             fps = self.config.output.fps
@@ -110,58 +361,112 @@ class VideoExporter:
         num_frames = int(fps * duration)
         frame_duration = int(1000 / fps)  # ms per frame
         
-        # Generate frames
-        frames = self.generate_frames(num_frames)
-        
-        if not frames:
-            raise ValueError("No frames generated")
-        
         # Check if transparent
         is_transparent = self.config.output.transparent
         
+        # Stream frames into the encoder instead of holding them all as RGBA
+        frames = self.iter_frames(num_frames)
+        
         # Convert to palette mode for smaller GIF
         if optimize:
-            frames = [self._optimize_frame(f, transparent=is_transparent) for f in frames]
+            palette = self._gif_palette(transparent=is_transparent)
+            frames = self._optimize_frames(frames, palette, transparent=is_transparent)
+        
+        first = next(frames, None)
+        if first is None:
+            raise ValueError("No frames generated")
         
         # Save as GIF
         save_kwargs = {
+            "format": "GIF",
             "save_all": True,
-            "append_images": frames[1:],
+            "append_images": frames,
             "duration": frame_duration,
             "loop": loop,
             "optimize": optimize,
         }
         
         # Add transparency settings if needed
-        if is_transparent and 'transparency' in frames[0].info:
-            save_kwargs["transparency"] = frames[0].info['transparency']
+        if is_transparent and 'transparency' in first.info:
+            save_kwargs["transparency"] = first.info['transparency']
             save_kwargs["disposal"] = 2  # Restore to background
         
-        frames[0].save(path, **save_kwargs)
+        if not (GIFSICLE_ENABLED and optimize):
+            first.save(target, **save_kwargs)
+            return
         
-        return path
+        buffer = io.BytesIO()
+        first.save(buffer, **save_kwargs)
+        data = _gifsicle_optimize(buffer.getvalue())
+        if isinstance(target, (str, Path)):
+            Path(target).write_bytes(data)
+        else:
+            target.write(data)
+    
+    def _gif_palette(self, transparent: bool = False) -> Image.Image:
+        """
+        Build the one palette shared by every frame of a GIF.
+        
+        The palette comes from the fully revealed timeline (what the final
+        frames show), instead of running MEDIANCUT per frame. A single
+        palette also lets the GIF encoder diff consecutive frames.
+        """
+        self.renderer.render()
+        final = self.renderer.surface_to_pil()
+        
+        # Index 255 is reserved for the transparent color
+        colors = 255 if transparent else 256
+        return self._flatten_frame(final, transparent).quantize(
+            colors=colors, method=Image.Quantize.MEDIANCUT
+        )
+    
+    def _optimize_frames(
+        self,
+        frames: Iterator[Image.Image],
+        palette: Image.Image,
+        transparent: bool = False,
+    ) -> Iterator[Image.Image]:
+        """Map frames onto the shared palette, reusing the result for repeated frames."""
+        last_frame = last_result = None
+        for frame in frames:
+            if frame is not last_frame:
+                last_frame = frame
+                last_result = self._optimize_frame(frame, palette, transparent=transparent)
+            yield last_result
+    
+    def _flatten_frame(self, frame: Image.Image, transparent: bool = False) -> Image.Image:
+        """Convert a frame to RGB, compositing onto white unless transparent."""
+        if frame.mode != "RGBA":
+            return frame.convert("RGB")
+        if transparent:
+            # Alpha is restored as a transparency index after quantizing
+            return frame.convert("RGB")
+        alpha = frame.getchannel("A")
+        if alpha.getextrema()[0] == 255:
+            # Fully opaque: nothing to composite
+            return frame.convert("RGB")
+        background = Image.new("RGB", frame.size, (255, 255, 255))
+        background.paste(frame, mask=alpha)
+        return background
     
-    def _optimize_frame(self, frame: Image.Image, transparent: bool = False) -> Image.Image:
-        """Optimize a frame for GIF format."""
+    def _optimize_frame(
+        self,
+        frame: Image.Image,
+        palette: Image.Image,
+        transparent: bool = False,
+    ) -> Image.Image:
+        """Map a frame onto the shared GIF palette."""
+        quantized = self._flatten_frame(frame, transparent).quantize(
+            palette=palette, dither=Image.Dither.NONE
+        )
         if transparent and frame.mode == "RGBA":
-            # Keep transparency for GIF
-            # Convert RGBA to P with transparency
-            alpha = frame.split()[3]
-            frame = frame.convert("RGB").quantize(colors=255, method=Image.Quantize.MEDIANCUT)
-            frame = frame.convert("P")
-            # Set transparency index
-            mask = Image.eval(alpha, lambda a: 255 if a <= 128 else 0)
-            frame.paste(255, mask)
-            frame.info['transparency'] = 255
-            return frame
-        elif frame.mode == "RGBA":
-            # Create a white background for non-transparent
-            background = Image.new("RGB", frame.size, (255, 255, 255))
-            background.paste(frame, mask=frame.split()[3])
-            frame = background
-        
-        # Quantize to reduce colors
-        return frame.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+            # Keep transparency for GIF via a dedicated palette index;
+            # fully opaque frames have no pixels to punch out
+            alpha = frame.getchannel("A")
+            if alpha.getextrema()[0] <= 128:
+                quantized.paste(255, alpha.point(_GIF_TRANSPARENT_LUT))
+            quantized.info['transparency'] = 255
+        return quantized
     
     def export_mp4(
         self,
@@ -193,44 +498,60 @@ class VideoExporter:
             duration = self.config.output.duration
         
         num_frames = int(fps * duration)
-        
-        # Generate frames
-        frames = self.generate_frames(num_frames, include_hold_frames=True)
-        
-        if not frames:
+        if num_frames <= 0:
             raise ValueError("No frames generated")
         
-        # Try to use moviepy for MP4 export
-        try:
-            from moviepy.editor import ImageSequenceClip
-            
-            # Convert PIL frames to numpy arrays
-            import numpy as np
-            frame_arrays = [np.array(f.convert("RGB")) for f in frames]
-            
-            # Create video clip
-            clip = ImageSequenceClip(frame_arrays, fps=fps)
-            
-            # Write video
-            clip.write_videofile(
-                str(path),
-                codec=codec,
-                bitrate=bitrate,
-                audio=False,
-                verbose=False,
-                logger=None,
-            )
-            
-        except ImportError:
+        ffmpeg = _find_ffmpeg()
+        if ffmpeg is None:
             # Fallback: save as GIF and inform user
             gif_path = path.with_suffix(".gif")
             self.export_gif(gif_path, fps, duration)
             raise RuntimeError(
-                f"moviepy not available for MP4 export. "
+                f"ffmpeg not available for MP4 export. "
                 f"GIF saved to {gif_path} instead. "
-                f"Install moviepy with: pip install moviepy"
+                f"Install moviepy (which bundles ffmpeg) with: pip install moviepy"
             )
         
+        # Stream Cairo's raw BGRA frames into ffmpeg's stdin so only the
+        # frame being encoded is held in memory, with no RGB conversion.
+        width, height = self.config.output.width, self.config.output.height
+        cmd = [
+            ffmpeg, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgra",
+            "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "-",
+            "-an", "-c:v", codec, "-b:v", bitrate,
+        ]
+        if codec == "libx264" and width % 2 == 0 and height % 2 == 0:
+            # Widely playable output (same choice moviepy makes)
+            cmd += ["-pix_fmt", "yuv420p"]
+        cmd.append(str(path))
+        
+        # ffmpeg's stderr goes to a scratch file: a pipe that nobody drains
+        # while frames are being written could fill up and stall both sides.
+        with tempfile.TemporaryFile(dir=_TMP_DIR) as stderr:
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=stderr)
+            try:
+                try:
+                    for buffer in self._iter_raw_frames(num_frames, include_hold_frames=True):
+                        proc.stdin.write(buffer)
+                finally:
+                    proc.stdin.close()
+            except BrokenPipeError:
+                # ffmpeg exited early; its stderr explains why
+                pass
+            except BaseException:
+                # Rendering failed: stop ffmpeg and drop the truncated video
+                proc.kill()
+                proc.wait()
+                path.unlink(missing_ok=True)
+                raise
+            
+            if proc.wait() != 0:
+                stderr.seek(0)
+                message = stderr.read().decode(errors="replace").strip()
+                raise RuntimeError(f"ffmpeg failed: {message}")
+        
         return path
     
     def export(
@@ -22,15 +22,18 @@ milestones[3]: date title description highlight
 ```
 """
 
-import json
+import mmap
 import re
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Union
 
-import yaml
 from pydantic import ValidationError
 
-from .models import TimelineConfig, QuickMilestone, Milestone
+from .models import TimelineConfig, Milestone, _split_quick
+
+
+# YAML files at least this large are parsed from a memory map
+MMAP_THRESHOLD = 256 * 1024
 
 
 class ParserError(Exception):
@@ -64,8 +67,13 @@ def parse_file(file_path: Union[str, Path]) -> TimelineConfig:
     
     suffix = path.suffix.lower()
     
+    if suffix in (".yaml", ".yml") and path.stat().st_size >= MMAP_THRESHOLD:
+        return _parse_yaml_mapped(path)
+    
     try:
-        content = path.read_text(encoding="utf-8")
+        # JSON is handed to the parser as raw UTF-8 bytes (no str round-trip)
+        raw = path.read_bytes()
+        content = raw if suffix == ".json" else raw.decode("utf-8")
     except Exception as e:
         raise ParserError(f"Failed to read file: {e}")
     
@@ -76,22 +84,37 @@ def parse_file(file_path: Union[str, Path]) -> TimelineConfig:
     elif suffix == ".toon":
         return parse_toon(content)
     else:
-        # Try YAML first (it's a superset of JSON)
-        try:
-            return parse_yaml(content)
-        except ParserError:
+        # Sniff the format so unknown files are parsed once, not up to three times
+        if content.lstrip()[:1] in ("{", "["):
             try:
                 return parse_json(content)
             except ParserError:
-                return parse_toon(content)
+                # YAML flow mappings also start with a brace
+                return parse_yaml(content)
+        if _TOON_HEADER_RE.search(content):
+            return parse_toon(content)
+        return parse_yaml(content)
 
 
-def parse_yaml(content: str) -> TimelineConfig:
+def _parse_yaml_mapped(path: Path) -> TimelineConfig:
+    """Parse a large YAML file by streaming it from a read-only memory map."""
+    try:
+        f = open(path, "rb")
+    except OSError as e:
+        raise ParserError(f"Failed to read file: {e}")
+    
+    # libyaml reads the mapping in chunks, so the file is never held as a
+    # full bytes copy plus a decoded str copy.
+    with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return parse_yaml(mm)
+
+
+def parse_yaml(content: Union[str, bytes, BinaryIO]) -> TimelineConfig:
     """
     Parse YAML content into a TimelineConfig.
     
     Args:
-        content: YAML string content.
+        content: YAML string content, or UTF-8 bytes or a binary stream.
         
     Returns:
         Validated TimelineConfig object.
@@ -99,8 +122,15 @@ def parse_yaml(content: str) -> TimelineConfig:
     Raises:
         ParserError: If the YAML is invalid or doesn't match schema.
     """
+    # Imported lazily: PyYAML is the heaviest parser dependency and is not
+    # needed for TOON or JSON configs.
+    import yaml
+    
+    # libyaml-backed loader when PyYAML was built with it; same safe schema
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    
     try:
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=loader)
     except yaml.YAMLError as e:
         raise ParserError(f"Invalid YAML: {e}")
     
@@ -113,12 +143,12 @@ def parse_yaml(content: str) -> TimelineConfig:
     return _validate_config(data)
 
 
-def parse_json(content: str) -> TimelineConfig:
+def parse_json(content: Union[str, bytes]) -> TimelineConfig:
     """
     Parse JSON content into a TimelineConfig.
     
     Args:
-        content: JSON string content.
+        content: JSON string content, or UTF-8 encoded bytes.
         
     Returns:
         Validated TimelineConfig object.
@@ -126,15 +156,19 @@ def parse_json(content: str) -> TimelineConfig:
     Raises:
         ParserError: If the JSON is invalid or doesn't match schema.
     """
+    # Decode and validate in a single pass (pydantic-core's JSON parser)
+    # rather than json.loads() followed by validation of the resulting dict.
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
-        raise ParserError(f"Invalid JSON: {e}")
-    
-    if not isinstance(data, dict):
-        raise ParserError("JSON must contain an object at the root level")
-    
-    return _validate_config(data)
+        return TimelineConfig.model_validate_json(content)
+    except ValidationError as e:
+        errors = e.errors()
+        if any(error["type"] == "json_invalid" for error in errors):
+            # pydantic's message already carries the "Invalid JSON: " prefix
+            message = errors[0]["msg"].removeprefix("Invalid JSON: ")
+            raise ParserError(f"Invalid JSON: {message}")
+        if any(error["type"] == "model_type" and not error["loc"] for error in errors):
+            raise ParserError("JSON must contain an object at the root level")
+        raise ParserError("Validation failed:", _format_validation_errors(e))
 
 
 def parse_toon(content: str) -> TimelineConfig:
@@ -169,6 +203,19 @@ def parse_toon(content: str) -> TimelineConfig:
     return _validate_config(data)
 
 
+# TOON line patterns, compiled once. All are anchored and free of nested
+# quantifiers, so matching is linear in the line length.
+_TOON_TABULAR_RE = re.compile(r'^(\w+)\[(\d+)\]:\s*(.+)$')
+_TOON_ARRAY_RE = re.compile(r'^(\w+)\[(\d+)\]:?\s*$')
+_TOON_KV_RE = re.compile(r'^(\w+):\s*(.*)$')
+_TOON_HEADER_RE = re.compile(r'^\w+\[\d+\]', re.MULTILINE)
+_TOON_DEDENT_RE = re.compile(r'^  |\t')
+_TOON_INDENTS = ('  ', '\t')
+
+# Case-insensitive TOON keywords and the values they stand for
+_TOON_LITERALS = {'null': None, 'none': None, 'true': True, 'false': False}
+
+
 def _toon_to_dict(content: str) -> dict:
     """
     Convert TOON format to Python dictionary.
@@ -181,10 +228,13 @@ def _toon_to_dict(content: str) -> dict:
     """
     result = {}
     lines = content.strip().split('\n')
+    # Strip every line once up front; the loops below only index into these
+    stripped = [line.strip() for line in lines]
+    num_lines = len(lines)
     i = 0
     
-    while i < len(lines):
-        line = lines[i].strip()
+    while i < num_lines:
+        line = stripped[i]
         
         # Skip empty lines and comments
         if not line or line.startswith('#'):
@@ -192,7 +242,7 @@ def _toon_to_dict(content: str) -> dict:
             continue
         
         # Check for tabular array: key[N]: field1 field2 ...
-        array_match = re.match(r'^(\w+)\[(\d+)\]:\s*(.+)$', line)
+        array_match = _TOON_TABULAR_RE.match(line)
         if array_match:
             key = array_match.group(1)
             count = int(array_match.group(2))
@@ -202,20 +252,16 @@ def _toon_to_dict(content: str) -> dict:
             rows = []
             for j in range(count):
                 i += 1
-                if i < len(lines):
-                    row_values = _parse_toon_row(lines[i].strip(), len(fields))
-                    row_dict = {}
-                    for k, field in enumerate(fields):
-                        if k < len(row_values):
-                            row_dict[field] = row_values[k]
-                    rows.append(row_dict)
+                if i < num_lines:
+                    row_values = _parse_toon_row(stripped[i], len(fields))
+                    rows.append(dict(zip(fields, row_values)))
             
             result[key] = rows
             i += 1
             continue
         
         # Check for simple array: key[N]: (values on next lines)
-        simple_array_match = re.match(r'^(\w+)\[(\d+)\]:?\s*$', line)
+        simple_array_match = _TOON_ARRAY_RE.match(line)
         if simple_array_match:
             key = simple_array_match.group(1)
             count = int(simple_array_match.group(2))
@@ -223,30 +269,29 @@ def _toon_to_dict(content: str) -> dict:
             values = []
             for j in range(count):
                 i += 1
-                if i < len(lines):
-                    values.append(_parse_toon_value(lines[i].strip()))
+                if i < num_lines:
+                    values.append(_parse_toon_value(stripped[i]))
             
             result[key] = values
             i += 1
             continue
         
         # Simple key: value pair
-        kv_match = re.match(r'^(\w+):\s*(.*)$', line)
+        kv_match = _TOON_KV_RE.match(line)
         if kv_match:
             key = kv_match.group(1)
             value_str = kv_match.group(2).strip()
             
             # Check if value is a nested object (next lines indented)
-            if not value_str and i + 1 < len(lines):
-                next_line = lines[i + 1]
-                if next_line and (next_line.startswith('  ') or next_line.startswith('\t')):
+            if not value_str and i + 1 < num_lines:
+                if lines[i + 1].startswith(_TOON_INDENTS):
                     # Collect nested content
                     nested_lines = []
                     i += 1
-                    while i < len(lines) and (lines[i].startswith('  ') or lines[i].startswith('\t') or not lines[i].strip()):
-                        if lines[i].strip():
+                    while i < num_lines and (lines[i].startswith(_TOON_INDENTS) or not stripped[i]):
+                        if stripped[i]:
                             # Remove one level of indentation
-                            nested_lines.append(re.sub(r'^  |\t', '', lines[i]))
+                            nested_lines.append(_TOON_DEDENT_RE.sub('', lines[i], count=1))
                         i += 1
                     result[key] = _toon_to_dict('\n'.join(nested_lines))
                     continue
@@ -266,26 +311,45 @@ def _parse_toon_fields(field_str: str) -> list[str]:
 
 
 def _parse_toon_row(row_str: str, expected_count: int) -> list:
-    """Parse a TOON data row, handling quoted strings."""
+    """
+    Parse a TOON data row, handling quoted strings.
+    
+    Only the first ``expected_count`` values are used by the caller, so a
+    quoted row stops scanning once that many values have been collected.
+    """
+    # Fast path: no quotes means plain space-separated tokens
+    if '"' not in row_str:
+        return [_parse_toon_value(token) for token in row_str.split(' ') if token]
+    
+    # Scan quote to quote with str.find instead of walking characters.
+    # Quoted text is kept verbatim; text glued to an opening quote joins it.
     values = []
     current = ""
-    in_quotes = False
-    
-    for char in row_str + " ":
-        if char == '"' and not in_quotes:
-            in_quotes = True
-        elif char == '"' and in_quotes:
-            in_quotes = False
-            values.append(current)
-            current = ""
-        elif char == ' ' and not in_quotes:
+    pos = 0
+    while True:
+        quote = row_str.find('"', pos)
+        tokens = (row_str[pos:] if quote < 0 else row_str[pos:quote]).split(' ')
+        tokens[0] = current + tokens[0]
+        for token in tokens[:-1]:
+            if token:
+                values.append(_parse_toon_value(token))
+        current = tokens[-1]
+        
+        if quote < 0:
             if current:
                 values.append(_parse_toon_value(current))
-                current = ""
-        else:
-            current += char
-    
-    return values
+            return values
+        
+        close = row_str.find('"', quote + 1)
+        if close < 0:
+            # Unterminated quote: the rest of the row is dropped
+            return values
+        values.append(current + row_str[quote + 1:close])
+        if len(values) >= expected_count:
+            # Values past the declared fields are never read
+            return values
+        current = ""
+        pos = close + 1
 
 
 def _parse_toon_value(value_str: str):
@@ -298,20 +362,20 @@ def _parse_toon_value(value_str: str):
         return value_str[1:-1]
     
     # Handle special values
-    if value_str.lower() == 'null' or value_str.lower() == 'none':
-        return None
-    if value_str.lower() == 'true':
-        return True
-    if value_str.lower() == 'false':
-        return False
-    
-    # Try numeric conversion
-    try:
-        if '.' in value_str:
-            return float(value_str)
-        return int(value_str)
-    except ValueError:
-        pass
+    lowered = value_str.lower()
+    if lowered in _TOON_LITERALS:
+        return _TOON_LITERALS[lowered]
+    
+    # Try numeric conversion, but only for tokens that can start a number;
+    # raising ValueError for every plain word is comparatively expensive.
+    first = value_str.lstrip()[:1]
+    if first and (first.isdigit() or first in '+-.'):
+        try:
+            if '.' in value_str:
+                return float(value_str)
+            return int(value_str)
+        except ValueError:
+            pass
     
     return value_str
 
@@ -332,12 +396,17 @@ def _validate_config(data: dict) -> TimelineConfig:
     try:
         return TimelineConfig(**data)
     except ValidationError as e:
-        errors = []
-        for error in e.errors():
-            loc = " -> ".join(str(x) for x in error["loc"])
-            msg = error["msg"]
-            errors.append(f"  {loc}: {msg}")
-        raise ParserError("Validation failed:", errors)
+        raise ParserError("Validation failed:", _format_validation_errors(e))
+
+
+def _format_validation_errors(e: ValidationError) -> list[str]:
+    """Format Pydantic validation errors as indented 'loc: msg' lines."""
+    errors = []
+    for error in e.errors():
+        loc = " -> ".join(str(x) for x in error["loc"])
+        msg = error["msg"]
+        errors.append(f"  {loc}: {msg}")
+    return errors
 
 
 def parse_quick_milestones(milestone_strings: list[str]) -> list[Milestone]:
@@ -356,10 +425,12 @@ def parse_quick_milestones(milestone_strings: list[str]) -> list[Milestone]:
     milestones = []
     errors = []
     
+    # Builds each Milestone directly rather than validating an intermediate
+    # QuickMilestone first; the string format is shared with from_string.
     for i, s in enumerate(milestone_strings):
         try:
-            quick = QuickMilestone.from_string(s)
-            milestones.append(quick.to_milestone())
+            date, title = _split_quick(s)
+            milestones.append(Milestone(date=date, title=title))
         except ValueError as e:
             errors.append(f"  Milestone {i + 1}: {e}")
         except Exception as e:
@@ -1,11 +1,43 @@
 """Timeline style renderers."""
 
+import functools
+import importlib
+
 from .base import BaseRenderer
-from .horizontal import HorizontalRenderer
-from .vertical import VerticalRenderer
-from .gantt import GanttRenderer
-from .roadmap import RoadmapRenderer
-from .infographic import InfographicRenderer
+
+# Style name -> (module, class); style modules are imported on first use
+_RENDERERS = {
+    "horizontal": (".horizontal", "HorizontalRenderer"),
+    "vertical": (".vertical", "VerticalRenderer"),
+    "gantt": (".gantt", "GanttRenderer"),
+    "roadmap": (".roadmap", "RoadmapRenderer"),
+    "infographic": (".infographic", "InfographicRenderer"),
+}
+_CLASS_STYLES = {class_name: style for style, (_, class_name) in _RENDERERS.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def get_renderer_class(style: str) -> type:
+    """
+    Import and return the renderer class for a timeline style.
+    
+    Args:
+        style: Style name (``TimelineStyle`` value); unknown styles fall
+            back to the horizontal renderer
+        
+    Returns:
+        BaseRenderer subclass
+    """
+    module_name, class_name = _RENDERERS.get(style, _RENDERERS["horizontal"])
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+
+def __getattr__(name: str):
+    """Resolve renderer class names lazily, e.g. ``HorizontalRenderer``."""
+    if name in _CLASS_STYLES:
+        return get_renderer_class(_CLASS_STYLES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseRenderer",
@@ -14,5 +46,5 @@ __all__ = [
     "GanttRenderer",
     "RoadmapRenderer",
     "InfographicRenderer",
+    "get_renderer_class",
 ]
-
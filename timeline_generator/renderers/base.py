@@ -1,19 +1,38 @@
 """Base renderer class with Cairo setup."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import contextmanager
+from itertools import accumulate
+from typing import Iterable, Iterator, Optional, Sequence
 import io
 import math
+import threading
 
 import cairo
 from PIL import Image
 
 from ..models import TimelineConfig
-from ..core.scale import ScaleInfo, calculate_scale, TimeScale as CoreTimeScale
-from ..core.layout import TimelineLayout, LayoutEngine
+from ..core.scale import ScaleInfo, calculate_scale, dates_to_positions, TimeScale as CoreTimeScale
+from ..core.layout import TimelineLayout, MilestoneLayout, LayoutEngine
 from ..themes.base import Theme
 
 
+# Rounded-rect outlines kept per renderer before the cache is reset
+_MAX_CACHED_PATHS = 256
+
+# Image surfaces released by finished renderers, by (width, height). Servers
+# render many same-sized timelines; reusing the buffers skips allocating and
+# zero-filling a full ARGB surface per request.
+_MAX_POOLED_SURFACES = 4
+_surface_pool: dict[tuple[int, int], list[cairo.ImageSurface]] = {}
+_surface_pool_lock = threading.Lock()
+
+
+def _font_key(font_config) -> tuple:
+    """Hashable identity of a FontConfig."""
+    return (font_config.family, font_config.size, font_config.bold, font_config.italic)
+
+
 class BaseRenderer(ABC):
     """Abstract base class for timeline renderers."""
     
@@ -41,18 +60,72 @@ class BaseRenderer(ABC):
         # Cairo surfaces and contexts
         self._surface: Optional[cairo.ImageSurface] = None
         self._ctx: Optional[cairo.Context] = None
+        
+        # Text measurements by (font, text); kept across renders and frames
+        self._extents_cache: dict[tuple, cairo.TextExtents] = {}
+        
+        # (context, font key) of the font last selected through _apply_font
+        self._font_state: Optional[tuple[cairo.Context, tuple]] = None
+        
+        # Opaque source patterns by color string, reused by every primitive
+        self._pattern_cache: dict[str, cairo.SolidPattern] = {}
+        
+        # Progress-independent state shared by all animation frames
+        self._drop_frame_caches()
+        
+        # Major tick positions by (axis length, axis start); the scale is fixed
+        self._tick_cache: dict[tuple[float, float], list[float]] = {}
+        
+        # Rounded-rect outlines at the origin by (width, height, radius)
+        self._path_cache: dict[tuple[float, float, float], cairo.Path] = {}
+        
+        # Formatted date labels by (date, format)
+        self._date_labels: dict[tuple, str] = {}
+    
+    def __enter__(self) -> "BaseRenderer":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.release()
     
     @property
     def surface(self) -> cairo.ImageSurface:
-        """Get or create the Cairo surface."""
+        """Get or create the Cairo surface (reusing a released one if possible)."""
         if self._surface is None:
-            self._surface = cairo.ImageSurface(
-                cairo.FORMAT_ARGB32,
-                self.width,
-                self.height,
-            )
+            with _surface_pool_lock:
+                bucket = _surface_pool.get((self.width, self.height))
+                self._surface = bucket.pop() if bucket else None
+            if self._surface is None:
+                self._surface = cairo.ImageSurface(
+                    cairo.FORMAT_ARGB32,
+                    self.width,
+                    self.height,
+                )
         return self._surface
     
+    def release(self) -> None:
+        """
+        Hand the image surface back for reuse by later renderers.
+        
+        Call when done exporting (or use the renderer as a context manager);
+        the renderer stays usable and allocates again if needed.
+        """
+        surface = self._surface
+        self._surface = None
+        self._ctx = None
+        if not isinstance(surface, cairo.ImageSurface):
+            return
+        
+        # Pooled surfaces are handed out already cleared
+        ctx = cairo.Context(surface)
+        ctx.set_operator(cairo.OPERATOR_CLEAR)
+        ctx.paint()
+        surface.flush()
+        with _surface_pool_lock:
+            bucket = _surface_pool.setdefault((self.width, self.height), [])
+            if len(bucket) < _MAX_POOLED_SURFACES:
+                bucket.append(surface)
+    
     @property
     def ctx(self) -> cairo.Context:
         """Get or create the Cairo context."""
@@ -61,24 +134,80 @@ class BaseRenderer(ABC):
         return self._ctx
     
     def reset_surface(self) -> None:
-        """Reset the surface for a new render."""
+        """Drop the surface; the next access allocates a new one."""
         self._surface = None
         self._ctx = None
+        self._drop_frame_caches()
+    
+    def _drop_frame_caches(self) -> None:
+        """Forget state derived from the config and theme (layout, layers, plans)."""
+        self._layout: Optional[TimelineLayout] = None
+        self._static_layer: Optional[cairo.ImageSurface] = None
+        self._background: Optional[cairo.Pattern] = None
+        self._milestone_indices: Optional[dict[int, int]] = None
+        self._milestone_plans: dict[int, cairo.RecordingSurface] = {}
+    
+    def clear_surface(self) -> None:
+        """
+        Clear the surface for a new frame, keeping its pixel buffer.
+        
+        Animation frames all share one size, so reusing the buffer avoids
+        allocating and zero-filling a full ARGB surface per frame. A fresh
+        context is still created so no drawing state leaks between frames.
+        """
+        if not isinstance(self._surface, cairo.ImageSurface):
+            self.reset_surface()
+            return
+        self._ctx = cairo.Context(self._surface)
+        self._ctx.set_operator(cairo.OPERATOR_CLEAR)
+        self._ctx.paint()
+        self._ctx.set_operator(cairo.OPERATOR_OVER)
     
     def render(self) -> cairo.ImageSurface:
         """
         Render the timeline to a Cairo surface.
         
+        Layout and other derived state are rebuilt, so a render always
+        reflects the current config and theme.
+        
         Returns:
             The rendered Cairo surface.
         """
-        self.reset_surface()
+        self._drop_frame_caches()
+        self.clear_surface()
+        self._draw_timeline()
+        return self.surface
+    
+    def render_to(self, surface: cairo.Surface) -> None:
+        """
+        Render the full timeline onto an existing surface (e.g. SVG).
+        
+        The renderer's own image surface is left untouched.
         
+        Args:
+            surface: Cairo surface to draw on.
+        """
+        with self._drawing_on(surface):
+            self._draw_timeline()
+    
+    @contextmanager
+    def _drawing_on(self, surface: cairo.Surface) -> Iterator[cairo.Context]:
+        """Temporarily direct all drawing to another surface."""
+        saved = self._surface, self._ctx
+        self._surface = surface
+        self._ctx = cairo.Context(surface)
+        try:
+            yield self._ctx
+        finally:
+            self._surface, self._ctx = saved
+    
+    def _draw_timeline(self) -> None:
+        """Draw the complete, non-animated timeline on the current context."""
         # Draw background
         self.draw_background()
         
         # Calculate layout
-        layout = self.calculate_layout()
+        layout = self._get_layout()
         
         # Draw title
         if self.config.show_title:
@@ -90,11 +219,11 @@ class BaseRenderer(ABC):
         # Draw scale markers
         self.draw_scale_markers(layout)
         
-        # Draw milestones
+        # Draw milestones. Layout order is also z-order: labels, cards and
+        # connectors of neighbouring milestones can overlap, so the loop is
+        # not regrouped by color (opaque colors already reuse cached patterns).
         for ml in layout.milestone_layouts:
             self.draw_milestone(ml, layout)
-        
-        return self.surface
     
     def render_frame(self, progress: float) -> cairo.ImageSurface:
         """
@@ -106,20 +235,14 @@ class BaseRenderer(ABC):
         Returns:
             The rendered Cairo surface for this frame.
         """
-        self.reset_surface()
-        
-        # Draw background
-        self.draw_background()
-        
-        # Calculate layout
-        layout = self.calculate_layout()
+        self.clear_surface()
         
-        # Draw title (always visible)
-        if self.config.show_title:
-            self.draw_title(layout)
-        
-        # Draw axis
-        self.draw_axis(layout)
+        # Background, title and axis are identical in every frame
+        layout = self._get_layout()
+        self.ctx.set_source_surface(self._get_static_layer(layout), 0, 0)
+        self.ctx.set_operator(cairo.OPERATOR_SOURCE)
+        self.ctx.paint()
+        self.ctx.set_operator(cairo.OPERATOR_OVER)
         
         # Calculate how many milestones to show
         num_milestones = len(layout.milestone_layouts)
@@ -134,10 +257,102 @@ class BaseRenderer(ABC):
             if i < visible_count:
                 # Calculate per-milestone opacity for smooth transitions
                 milestone_progress = min(1.0, (progress * (num_milestones + 1) - i))
-                self.draw_milestone(ml, layout, opacity=milestone_progress)
+                self.ctx.set_source_surface(self._milestone_plan(i, ml, layout), 0, 0)
+                if milestone_progress < 1.0:
+                    self.ctx.paint_with_alpha(milestone_progress)
+                else:
+                    self.ctx.paint()
         
         return self.surface
     
+    def _get_layout(self) -> TimelineLayout:
+        """Get the layout, calculating it once per config."""
+        if self._layout is None:
+            self._layout = self.calculate_layout()
+        return self._layout
+    
+    def _tick_positions(self, length: float, offset: float = 0.0) -> list[float]:
+        """
+        Get pixel positions of the scale's major ticks along an axis.
+        
+        Computed in one batch and cached, since every frame of an animation
+        draws the same ticks.
+        
+        Args:
+            length: Axis length in pixels.
+            offset: Axis start position in pixels.
+            
+        Returns:
+            One position per major tick.
+        """
+        key = (length, offset)
+        positions = self._tick_cache.get(key)
+        if positions is None:
+            positions = self._tick_cache[key] = dates_to_positions(
+                self.scale_info.major_ticks, self.scale_info, length, offset
+            )
+        return positions
+    
+    def _date_label(self, date, fmt: str) -> str:
+        """Format a date for display, once per (date, format)."""
+        key = (date, fmt)
+        label = self._date_labels.get(key)
+        if label is None:
+            label = self._date_labels[key] = date.strftime(fmt)
+        return label
+    
+    def _milestone_index(self, milestone) -> int:
+        """Get a milestone's position in the config without scanning the list."""
+        if self._milestone_indices is None:
+            self._milestone_indices = {
+                id(m): i for i, m in enumerate(self.config.milestones)
+            }
+        index = self._milestone_indices.get(id(milestone))
+        if index is None:
+            # Not one of the config's own objects; fall back to equality
+            return self.config.milestones.index(milestone)
+        return index
+    
+    def _milestone_color(self, milestone) -> str:
+        """Get a milestone's color: its own, else the theme accent for its position."""
+        return milestone.color or self.theme.colors.get_accent(self._milestone_index(milestone))
+    
+    def _milestone_plan(self, index: int, ml: MilestoneLayout, layout: TimelineLayout) -> cairo.RecordingSurface:
+        """
+        Get a milestone's drawing recorded once as a replayable Cairo command list.
+        
+        Color lookup, date formatting, text measurement and path building all
+        happen on the first frame only; later frames replay the recording,
+        fading it in with a single paint_with_alpha.
+        """
+        plan = self._milestone_plans.get(index)
+        if plan is None:
+            plan = cairo.RecordingSurface(
+                cairo.CONTENT_COLOR_ALPHA,
+                cairo.Rectangle(0, 0, self.width, self.height),
+            )
+            with self._drawing_on(plan):
+                self.draw_milestone(ml, layout)
+            self._milestone_plans[index] = plan
+        return plan
+    
+    def _get_static_layer(self, layout: TimelineLayout) -> cairo.ImageSurface:
+        """
+        Get the background, title and axis drawn once on their own surface.
+        
+        Animation frames start by copying this layer instead of redrawing it.
+        """
+        if self._static_layer is None:
+            layer = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.width, self.height)
+            with self._drawing_on(layer):
+                self.draw_background()
+                if self.config.show_title:
+                    self.draw_title(layout)
+                self.draw_axis(layout)
+            layer.flush()
+            self._static_layer = layer
+        return self._static_layer
+    
     @abstractmethod
     def calculate_layout(self) -> TimelineLayout:
         """Calculate the layout for this style."""
@@ -154,22 +369,25 @@ class BaseRenderer(ABC):
             self.ctx.set_operator(cairo.OPERATOR_OVER)
             return
         
-        r, g, b, a = self.theme.hex_to_rgba(self.theme.colors.background)
-        self.ctx.set_source_rgba(r, g, b, a)
+        if self._background is None:
+            self._background = self._build_background()
+        self.ctx.set_source(self._background)
         self.ctx.rectangle(0, 0, self.width, self.height)
         self.ctx.fill()
-        
-        # Optional gradient or pattern
-        if self.theme.colors.background != self.theme.colors.background_alt:
-            # Subtle gradient
-            gradient = cairo.LinearGradient(0, 0, 0, self.height)
-            r1, g1, b1, _ = self.theme.hex_to_rgba(self.theme.colors.background)
-            r2, g2, b2, _ = self.theme.hex_to_rgba(self.theme.colors.background_alt)
-            gradient.add_color_stop_rgba(0, r1, g1, b1, 1)
-            gradient.add_color_stop_rgba(1, r2, g2, b2, 1)
-            self.ctx.set_source(gradient)
-            self.ctx.rectangle(0, 0, self.width, self.height)
-            self.ctx.fill()
+    
+    def _build_background(self) -> cairo.Pattern:
+        """Build the background fill: solid, or a subtle vertical gradient."""
+        colors = self.theme.colors
+        if colors.background == colors.background_alt:
+            return cairo.SolidPattern(*self.theme.hex_to_rgba(colors.background))
+        
+        # The gradient is opaque, so it needs no solid fill underneath
+        gradient = cairo.LinearGradient(0, 0, 0, self.height)
+        r1, g1, b1 = self.theme.hex_to_rgb(colors.background)
+        r2, g2, b2 = self.theme.hex_to_rgb(colors.background_alt)
+        gradient.add_color_stop_rgba(0, r1, g1, b1, 1)
+        gradient.add_color_stop_rgba(1, r2, g2, b2, 1)
+        return gradient
     
     def draw_title(self, layout: TimelineLayout) -> None:
         """Draw the title and subtitle."""
@@ -177,12 +395,12 @@ class BaseRenderer(ABC):
             return
         
         # Title
-        self.theme.apply_font(self.ctx, self.theme.title_font)
+        self._apply_font(self.theme.title_font)
         r, g, b, a = self.theme.hex_to_rgba(self.theme.colors.text_primary)
         self.ctx.set_source_rgba(r, g, b, a)
         
         # Center the title
-        extents = self.ctx.text_extents(self.config.title)
+        extents = self._text_extents(self.config.title, self.theme.title_font)
         x = layout.title_area.x + (layout.title_area.width - extents.width) / 2
         y = layout.title_area.y + self.theme.title_font.size
         
@@ -191,11 +409,11 @@ class BaseRenderer(ABC):
         
         # Subtitle
         if self.config.subtitle:
-            self.theme.apply_font(self.ctx, self.theme.subtitle_font)
+            self._apply_font(self.theme.subtitle_font)
             r, g, b, a = self.theme.hex_to_rgba(self.theme.colors.text_secondary)
             self.ctx.set_source_rgba(r, g, b, a)
             
-            extents = self.ctx.text_extents(self.config.subtitle)
+            extents = self._text_extents(self.config.subtitle, self.theme.subtitle_font)
             x = layout.title_area.x + (layout.title_area.width - extents.width) / 2
             y = layout.title_area.y + self.theme.title_font.size + self.theme.subtitle_font.size + 10
             
@@ -222,6 +440,23 @@ class BaseRenderer(ABC):
         """Draw a single milestone."""
         pass
     
+    def _set_source(self, color: str, opacity: float = 1.0) -> None:
+        """
+        Set a solid source color on the context.
+        
+        Fully opaque colors (the common case) reuse one cached pattern per
+        color; animated opacities vary per frame and are set directly.
+        """
+        if opacity == 1.0:
+            pattern = self._pattern_cache.get(color)
+            if pattern is None:
+                r, g, b = self.theme.hex_to_rgb(color)
+                pattern = self._pattern_cache[color] = cairo.SolidPattern(r, g, b, 1.0)
+            self.ctx.set_source(pattern)
+            return
+        r, g, b = self.theme.hex_to_rgb(color)
+        self.ctx.set_source_rgba(r, g, b, opacity)
+    
     def draw_circle(
         self,
         x: float,
@@ -236,18 +471,16 @@ class BaseRenderer(ABC):
         self.ctx.arc(x, y, radius, 0, 2 * math.pi)
         
         # Fill
-        r, g, b, _ = self.theme.hex_to_rgba(fill_color)
-        self.ctx.set_source_rgba(r, g, b, opacity)
-        self.ctx.fill_preserve()
-        
-        # Stroke
+        self._set_source(fill_color, opacity)
         if stroke_color:
-            r, g, b, _ = self.theme.hex_to_rgba(stroke_color)
-            self.ctx.set_source_rgba(r, g, b, opacity)
+            self.ctx.fill_preserve()
+            
+            # Stroke
+            self._set_source(stroke_color, opacity)
             self.ctx.set_line_width(stroke_width)
             self.ctx.stroke()
         else:
-            self.ctx.new_path()
+            self.ctx.fill()
     
     def draw_rounded_rect(
         self,
@@ -262,27 +495,61 @@ class BaseRenderer(ABC):
         opacity: float = 1.0,
     ) -> None:
         """Draw a rounded rectangle."""
-        # Create rounded rectangle path
+        # Rounded rectangle path, built once per shape and placed by translation
+        self.ctx.save()
+        self.ctx.translate(x, y)
         self.ctx.new_path()
-        self.ctx.arc(x + radius, y + radius, radius, math.pi, 1.5 * math.pi)
-        self.ctx.arc(x + width - radius, y + radius, radius, 1.5 * math.pi, 2 * math.pi)
-        self.ctx.arc(x + width - radius, y + height - radius, radius, 0, 0.5 * math.pi)
-        self.ctx.arc(x + radius, y + height - radius, radius, 0.5 * math.pi, math.pi)
-        self.ctx.close_path()
+        self.ctx.append_path(self._rounded_rect_path(width, height, radius))
         
         # Fill
-        r, g, b, _ = self.theme.hex_to_rgba(fill_color)
-        self.ctx.set_source_rgba(r, g, b, opacity)
-        self.ctx.fill_preserve()
-        
-        # Stroke
+        self._set_source(fill_color, opacity)
         if stroke_color:
-            r, g, b, _ = self.theme.hex_to_rgba(stroke_color)
-            self.ctx.set_source_rgba(r, g, b, opacity)
+            self.ctx.fill_preserve()
+            
+            # Stroke
+            self._set_source(stroke_color, opacity)
             self.ctx.set_line_width(stroke_width)
             self.ctx.stroke()
         else:
-            self.ctx.new_path()
+            self.ctx.fill()
+        self.ctx.restore()
+    
+    def draw_top_rounded_rect(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        radius: float,
+        fill_color: str,
+        opacity: float = 1.0,
+    ) -> None:
+        """Fill a rectangle whose top corners are rounded and bottom corners square."""
+        self.ctx.new_path()
+        self.ctx.arc(x + radius, y + radius, radius, math.pi, 1.5 * math.pi)
+        self.ctx.arc(x + width - radius, y + radius, radius, 1.5 * math.pi, 2 * math.pi)
+        self.ctx.line_to(x + width, y + height)
+        self.ctx.line_to(x, y + height)
+        self.ctx.close_path()
+        
+        self._set_source(fill_color, opacity)
+        self.ctx.fill()
+    
+    def _rounded_rect_path(self, width: float, height: float, radius: float) -> cairo.Path:
+        """Get a rounded-rectangle outline at the origin, building it on first use."""
+        key = (width, height, radius)
+        path = self._path_cache.get(key)
+        if path is None:
+            if len(self._path_cache) >= _MAX_CACHED_PATHS:
+                self._path_cache.clear()
+            scratch = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+            scratch.arc(radius, radius, radius, math.pi, 1.5 * math.pi)
+            scratch.arc(width - radius, radius, radius, 1.5 * math.pi, 2 * math.pi)
+            scratch.arc(width - radius, height - radius, radius, 0, 0.5 * math.pi)
+            scratch.arc(radius, height - radius, radius, 0.5 * math.pi, math.pi)
+            scratch.close_path()
+            path = self._path_cache[key] = scratch.copy_path()
+        return path
     
     def draw_line(
         self,
@@ -296,8 +563,7 @@ class BaseRenderer(ABC):
         dashed: bool = False,
     ) -> None:
         """Draw a line."""
-        r, g, b, _ = self.theme.hex_to_rgba(color)
-        self.ctx.set_source_rgba(r, g, b, opacity)
+        self._set_source(color, opacity)
         self.ctx.set_line_width(width)
         
         if dashed:
@@ -309,6 +575,34 @@ class BaseRenderer(ABC):
         self.ctx.line_to(x2, y2)
         self.ctx.stroke()
     
+    def draw_lines(
+        self,
+        segments: Sequence[tuple[float, float, float, float]],
+        color: str,
+        width: float = 2.0,
+        opacity: float = 1.0,
+        dashed: bool = False,
+    ) -> None:
+        """Draw many same-styled lines as one path with a single stroke.
+        
+        Args:
+            segments: (x1, y1, x2, y2) for each line.
+            color: Line color.
+            width: Line width.
+            opacity: Line opacity.
+            dashed: Whether to dash the lines.
+        """
+        if not segments:
+            return
+        self._set_source(color, opacity)
+        self.ctx.set_line_width(width)
+        self.ctx.set_dash([5, 5] if dashed else [])
+        
+        for x1, y1, x2, y2 in segments:
+            self.ctx.move_to(x1, y1)
+            self.ctx.line_to(x2, y2)
+        self.ctx.stroke()
+    
     def draw_text(
         self,
         text: str,
@@ -322,20 +616,19 @@ class BaseRenderer(ABC):
         wrap: Optional[bool] = None,
     ) -> None:
         """Draw text with optional wrapping and alignment."""
-        self.theme.apply_font(self.ctx, font_config)
-        r, g, b, _ = self.theme.hex_to_rgba(color)
-        self.ctx.set_source_rgba(r, g, b, opacity)
+        self._apply_font(font_config)
+        self._set_source(color, opacity)
         
         # Use config's text_wrap setting if wrap is not explicitly specified
         should_wrap = wrap if wrap is not None else self.config.text_wrap
         
         if max_width and should_wrap:
             # Word wrap text
-            lines = self._wrap_text(text, max_width)
+            lines = self._wrap_text(text, max_width, font_config)
             line_height = font_config.size * 1.3
             
             for i, line in enumerate(lines):
-                extents = self.ctx.text_extents(line)
+                extents = self._text_extents(line, font_config)
                 line_x = x
                 
                 if align == "center":
@@ -347,7 +640,7 @@ class BaseRenderer(ABC):
                 self.ctx.show_text(line)
             return
         
-        extents = self.ctx.text_extents(text)
+        extents = self._text_extents(text, font_config)
         
         if align == "center" and max_width:
             x = x + (max_width - extents.width) / 2
@@ -357,7 +650,64 @@ class BaseRenderer(ABC):
         self.ctx.move_to(x, y + font_config.size)
         self.ctx.show_text(text)
     
-    def _wrap_text(self, text: str, max_width: float) -> list[str]:
+    def _apply_font(self, font_config) -> None:
+        """Select a font on the context, skipping it if already selected there."""
+        key = _font_key(font_config)
+        state = self._font_state
+        if state is None or state[0] is not self.ctx or state[1] != key:
+            self.theme.apply_font(self.ctx, font_config)
+            self._font_state = (self.ctx, key)
+    
+    def _text_extents(self, text: str, font_config) -> cairo.TextExtents:
+        """
+        Measure text in the given font, memoized per renderer.
+        
+        Labels are measured repeatedly for wrapping, truncation and alignment,
+        and again on every animation frame; each Cairo measurement re-shapes
+        the whole string, so results are cached by font and text.
+        """
+        key = _font_key(font_config) + (text,)
+        extents = self._extents_cache.get(key)
+        if extents is None:
+            self._apply_font(font_config)
+            extents = self._extents_cache[key] = self.ctx.text_extents(text)
+        return extents
+    
+    def _prepare_labels(self, items: Iterable[tuple[str, object, Optional[float]]]) -> None:
+        """
+        Measure many labels up front, applying each distinct font only once.
+        
+        Fills the extents cache with what draw_text will ask for: the whole
+        string, or with wrapping on, the growing word prefixes of its first
+        line. Labels that fit on one line then draw without any further
+        Cairo measurement.
+        
+        Args:
+            items: (text, font_config, max_width) for each label.
+        """
+        by_font: dict[tuple, tuple[object, list[tuple[str, Optional[float]]]]] = {}
+        for text, font_config, max_width in items:
+            if not text:
+                continue
+            font_key = _font_key(font_config)
+            by_font.setdefault(font_key, (font_config, []))[1].append((text, max_width))
+        
+        for font_key, (font_config, texts) in by_font.items():
+            self._apply_font(font_config)
+            for text, max_width in texts:
+                if max_width and self.config.text_wrap:
+                    candidates = accumulate(text.split(), lambda line, word: f"{line} {word}")
+                else:
+                    candidates = (text,)
+                for candidate in candidates:
+                    key = font_key + (candidate,)
+                    extents = self._extents_cache.get(key)
+                    if extents is None:
+                        extents = self._extents_cache[key] = self.ctx.text_extents(candidate)
+                    if max_width and extents.width > max_width:
+                        break
+    
+    def _wrap_text(self, text: str, max_width: float, font_config) -> list[str]:
         """Wrap text to fit within max_width."""
         words = text.split()
         lines = []
@@ -365,7 +715,7 @@ class BaseRenderer(ABC):
         
         for word in words:
             test_line = f"{current_line} {word}".strip() if current_line else word
-            extents = self.ctx.text_extents(test_line)
+            extents = self._text_extents(test_line, font_config)
             
             if extents.width <= max_width:
                 current_line = test_line
@@ -373,11 +723,17 @@ class BaseRenderer(ABC):
                 if current_line:
                     lines.append(current_line)
                 # Check if single word is too long
-                if self.ctx.text_extents(word).width > max_width:
-                    # Truncate long word
-                    while len(word) > 3 and self.ctx.text_extents(word + "...").width > max_width:
-                        word = word[:-1]
-                    word = word + "..."
+                if self._text_extents(word, font_config).width > max_width:
+                    # Truncate long word: binary search for the longest prefix
+                    # (at least 3 characters) that fits with the ellipsis
+                    lo, hi = 3, len(word)
+                    while lo < hi:
+                        mid = (lo + hi + 1) // 2
+                        if self._text_extents(word[:mid] + "...", font_config).width <= max_width:
+                            lo = mid
+                        else:
+                            hi = mid - 1
+                    word = word[:lo] + "..."
                 current_line = word
         
         if current_line:
@@ -387,27 +743,30 @@ class BaseRenderer(ABC):
     
     def surface_to_pil(self) -> Image.Image:
         """Convert Cairo surface to PIL Image."""
-        # Get the data from the surface
+        # Get the data from the surface (flush pending drawing first)
+        self.surface.flush()
         buf = self.surface.get_data()
         
-        # Create PIL Image from buffer
-        img = Image.frombuffer(
+        # Decode BGRA straight into a new RGBA image. The swizzle already
+        # copies the pixels, so the result never aliases the surface.
+        return Image.frombytes(
             "RGBA",
             (self.width, self.height),
             buf,
             "raw",
             "BGRA",
-            0,
-            1,
+            self.surface.get_stride(),
         )
-        
-        return img.copy()  # Copy to detach from buffer
     
     def surface_to_bytes(self, format: str = "png") -> bytes:
         """Convert surface to bytes in specified format."""
-        img = self.surface_to_pil()
-        
         buffer = io.BytesIO()
+        if format.lower() == "png":
+            # Cairo encodes its ARGB32 surface directly, no PIL conversion
+            self.surface.write_to_png(buffer)
+            return buffer.getvalue()
+        
+        img = self.surface_to_pil()
         img.save(buffer, format=format.upper())
         return buffer.getvalue()
 
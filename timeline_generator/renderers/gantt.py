@@ -1,7 +1,6 @@
 """Gantt chart style renderer."""
 
 from ..core.layout import LayoutEngine, TimelineLayout, MilestoneLayout
-from ..core.scale import date_to_position
 from .base import BaseRenderer
 
 
@@ -35,29 +34,26 @@ class GanttRenderer(BaseRenderer):
         chart_width = x2 - x1
         header_height = y2 - y1
         
-        for i, (tick, label) in enumerate(zip(
-            self.scale_info.major_ticks,
-            self.scale_info.unit_labels,
-        )):
-            x = date_to_position(tick, self.scale_info, chart_width) + x1
-            
-            # Vertical grid line
-            self.draw_line(
-                x, y1,
-                x, self.height - self.theme.margin,
-                self.theme.colors.border,
-                1,
+        labels = self.scale_info.unit_labels
+        xs = self._tick_positions(chart_width, x1)[:len(labels)]
+        
+        # Vertical grid lines (one stroke for all of them)
+        bottom = self.height - self.theme.margin
+        self.draw_lines(
+            [(x, y1, x, bottom) for x in xs],
+            self.theme.colors.border,
+            1,
+        )
+        
+        # Labels in header
+        for x, label in zip(xs, labels):
+            self.draw_text(
+                label,
+                x + 5, y1 + 8,
+                self.theme.date_font,
+                self.theme.colors.text_light,
+                max_width=80,
             )
-            
-            # Label in header
-            if i < len(self.scale_info.unit_labels):
-                self.draw_text(
-                    label,
-                    x + 5, y1 + 8,
-                    self.theme.date_font,
-                    self.theme.colors.text_light,
-                    max_width=80,
-                )
     
     def draw_scale_markers(self, layout: TimelineLayout) -> None:
         """Draw row separators."""
@@ -69,14 +65,11 @@ class GanttRenderer(BaseRenderer):
         timeline_height = layout.timeline_area.height
         row_height = min(50, max(30, timeline_height / max(1, num_milestones)))
         
+        dividers = []
         for i in range(num_milestones + 1):
             y = layout.timeline_area.y + i * row_height
-            self.draw_line(
-                self.theme.margin, y,
-                self.width - self.theme.margin, y,
-                self.theme.colors.border,
-                0.5,
-            )
+            dividers.append((self.theme.margin, y, self.width - self.theme.margin, y))
+        self.draw_lines(dividers, self.theme.colors.border, 0.5)
     
     def draw_milestone(
         self,
@@ -88,11 +81,7 @@ class GanttRenderer(BaseRenderer):
         milestone = ml.milestone
         
         # Get color
-        if milestone.color:
-            color = milestone.color
-        else:
-            idx = self.config.milestones.index(milestone)
-            color = self.theme.colors.get_accent(idx)
+        color = self._milestone_color(milestone)
         
         # Draw label in left column
         self.draw_text(
@@ -154,12 +143,11 @@ class GanttRenderer(BaseRenderer):
             self.ctx.line_to(center_x - diamond_size / 2, center_y)
             self.ctx.close_path()
             
-            r, g, b, _ = self.theme.hex_to_rgba(color)
-            self.ctx.set_source_rgba(r, g, b, opacity)
+            self._set_source(color, opacity)
             self.ctx.fill()
         
         # Date labels
-        date_str = milestone.date.strftime("%b %d")
+        date_str = self._date_label(milestone.date, "%b %d")
         self.draw_text(
             date_str,
             bar.x, bar.y + bar.height + 2,
@@ -169,7 +157,7 @@ class GanttRenderer(BaseRenderer):
         )
         
         if milestone.end_date:
-            end_str = milestone.end_date.strftime("%b %d")
+            end_str = self._date_label(milestone.end_date, "%b %d")
             self.draw_text(
                 end_str,
                 bar.x + bar.width - 40, bar.y + bar.height + 2,
@@ -1,7 +1,6 @@
 """Horizontal timeline renderer."""
 
 from ..core.layout import LayoutEngine, TimelineLayout, MilestoneLayout
-from ..core.scale import date_to_position
 from .base import BaseRenderer
 
 
@@ -16,7 +15,26 @@ class HorizontalRenderer(BaseRenderer):
             self.width,
             self.height,
         )
-        return engine.calculate_horizontal_layout()
+        layout = engine.calculate_horizontal_layout()
+        
+        # Measure every label in one pass per font before drawing
+        labels = []
+        for ml in layout.milestone_layouts:
+            milestone = ml.milestone
+            labels.append((milestone.title, self.theme.label_font, ml.label_pos.width))
+            labels.append((
+                self._date_label(milestone.date, "%b %d, %Y"),
+                self.theme.date_font,
+                ml.label_pos.width,
+            ))
+            if ml.description_pos:
+                labels.append((
+                    milestone.description,
+                    self.theme.description_font,
+                    ml.description_pos.width,
+                ))
+        self._prepare_labels(labels)
+        return layout
     
     def draw_axis(self, layout: TimelineLayout) -> None:
         """Draw the horizontal timeline axis."""
@@ -37,8 +55,7 @@ class HorizontalRenderer(BaseRenderer):
         self.ctx.line_to(x2 - arrow_size, y2 + arrow_size / 2)
         self.ctx.close_path()
         
-        r, g, b, _ = self.theme.hex_to_rgba(self.theme.colors.primary)
-        self.ctx.set_source_rgba(r, g, b, 1)
+        self._set_source(self.theme.colors.primary)
         self.ctx.fill()
     
     def draw_scale_markers(self, layout: TimelineLayout) -> None:
@@ -47,22 +64,19 @@ class HorizontalRenderer(BaseRenderer):
         x2, _ = layout.axis_end
         timeline_width = x2 - x1
         
-        # Draw major ticks
-        for i, (tick, label) in enumerate(zip(
-            self.scale_info.major_ticks,
-            self.scale_info.unit_labels,
-        )):
-            x = date_to_position(tick, self.scale_info, timeline_width) + x1
-            
-            # Tick mark
-            tick_height = 10
-            self.draw_line(
-                x, y1 - tick_height / 2,
-                x, y1 + tick_height / 2,
-                self.theme.colors.primary,
-                self.theme.connector_width,
-            )
-            
+        # One marker per labelled major tick
+        labels = self.scale_info.unit_labels
+        xs = self._tick_positions(timeline_width, x1)[:len(labels)]
+        
+        # Draw major ticks (one stroke for all of them)
+        tick_height = 10
+        self.draw_lines(
+            [(x, y1 - tick_height / 2, x, y1 + tick_height / 2) for x in xs],
+            self.theme.colors.primary,
+            self.theme.connector_width,
+        )
+        
+        for x, label in zip(xs, labels):
             # Label below the line
             self.draw_text(
                 label,
@@ -83,11 +97,7 @@ class HorizontalRenderer(BaseRenderer):
         milestone = ml.milestone
         
         # Get color
-        if milestone.color:
-            color = milestone.color
-        else:
-            idx = self.config.milestones.index(milestone)
-            color = self.theme.colors.get_accent(idx)
+        color = self._milestone_color(milestone)
         
         # Draw connector line
         x1, y1 = ml.connector_start
@@ -143,7 +153,7 @@ class HorizontalRenderer(BaseRenderer):
         )
         
         # Draw date
-        date_str = milestone.date.strftime("%b %d, %Y")
+        date_str = self._date_label(milestone.date, "%b %d, %Y")
         if ml.is_above:
             date_y = ml.label_pos.y + self.theme.label_font.size + 5
         else:
@@ -1,14 +1,27 @@
 """Infographic style renderer."""
 
 import math
+from dataclasses import replace
+
+import cairo
 
 from ..core.layout import LayoutEngine, TimelineLayout, MilestoneLayout
-from .base import BaseRenderer
+from .base import BaseRenderer, _font_key
+
+
+# Unit vectors for the node ticks at 0, 90, 180 and 270 degrees
+_CARDINAL_DIRS = ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))
 
 
 class InfographicRenderer(BaseRenderer):
     """Renderer for creative infographic style timeline."""
     
+    def __init__(self, config, theme):
+        super().__init__(config, theme)
+        
+        # Theme fonts at the config's custom badge/title sizes
+        self._resized_fonts: dict[tuple, object] = {}
+    
     def calculate_layout(self) -> TimelineLayout:
         """Calculate infographic layout."""
         engine = LayoutEngine(
@@ -30,17 +43,17 @@ class InfographicRenderer(BaseRenderer):
         
         # Add decorative elements
         # Subtle pattern or shapes
-        r, g, b, _ = self.theme.hex_to_rgba(self.theme.colors.primary_light)
-        self.ctx.set_source_rgba(r, g, b, 0.05)
+        self._set_source(self.theme.colors.primary_light, 0.05)
         
-        # Draw decorative circles in background
+        # Draw decorative circles in background (one path, one fill)
         for i in range(5):
             cx = (i + 0.5) * self.width / 5
             cy = self.height * 0.7 + (i % 2) * 100
             radius = 100 + (i % 3) * 50
             
+            self.ctx.new_sub_path()
             self.ctx.arc(cx, cy, radius, 0, 2 * math.pi)
-            self.ctx.fill()
+        self.ctx.fill()
     
     def draw_axis(self, layout: TimelineLayout) -> None:
         """Draw connecting path between milestones."""
@@ -53,26 +66,23 @@ class InfographicRenderer(BaseRenderer):
         
         # Draw curved path connecting milestones
         self.ctx.set_line_width(self.theme.line_width)
-        r, g, b, _ = self.theme.hex_to_rgba(self.theme.colors.primary)
+        r, g, b = self.theme.hex_to_rgb(self.theme.colors.primary)
         self.ctx.set_source_rgba(r, g, b, line_opacity)
         
+        # Node centers, read once (center_x/center_y are computed properties)
+        centers = [
+            (ml.marker_pos.center_x, ml.marker_pos.center_y)
+            for ml in layout.milestone_layouts
+        ]
+        
         # Start path
-        first = layout.milestone_layouts[0]
-        self.ctx.move_to(first.marker_pos.center_x, first.marker_pos.center_y)
+        self.ctx.move_to(*centers[0])
         
         # Draw curves between milestones
-        for i in range(1, len(layout.milestone_layouts)):
-            current = layout.milestone_layouts[i]
-            prev = layout.milestone_layouts[i - 1]
-            
+        for (prev_x, prev_y), (x, y) in zip(centers, centers[1:]):
             # Control points for smooth curve
-            mid_x = (prev.marker_pos.center_x + current.marker_pos.center_x) / 2
-            
-            self.ctx.curve_to(
-                mid_x, prev.marker_pos.center_y,
-                mid_x, current.marker_pos.center_y,
-                current.marker_pos.center_x, current.marker_pos.center_y,
-            )
+            mid_x = (prev_x + x) / 2
+            self.ctx.curve_to(mid_x, prev_y, mid_x, y, x, y)
         
         self.ctx.stroke()
         
@@ -86,22 +96,31 @@ class InfographicRenderer(BaseRenderer):
             cy = ml.marker_pos.center_y
             radius = ml.marker_pos.width / 2 + 20
             
-            for angle in [0, math.pi / 2, math.pi, 3 * math.pi / 2]:
-                x1 = cx + math.cos(angle) * radius
-                y1 = cy + math.sin(angle) * radius
-                x2 = cx + math.cos(angle) * (radius + 15)
-                y2 = cy + math.sin(angle) * (radius + 15)
+            for dx, dy in _CARDINAL_DIRS:
+                x1 = cx + dx * radius
+                y1 = cy + dy * radius
+                x2 = cx + dx * (radius + 15)
+                y2 = cy + dy * (radius + 15)
                 
                 self.ctx.move_to(x1, y1)
                 self.ctx.line_to(x2, y2)
-                self.ctx.stroke()
         
+        # All ticks share one style: stroke them as a single path
+        self.ctx.stroke()
         self.ctx.set_dash([])
     
     def draw_scale_markers(self, layout: TimelineLayout) -> None:
         """No traditional scale markers for infographic style."""
         pass
     
+    def _resized_font(self, font_config, size: float):
+        """Get a theme font at a custom size, built once per (font, size)."""
+        key = _font_key(font_config) + (size,)
+        font = self._resized_fonts.get(key)
+        if font is None:
+            font = self._resized_fonts[key] = replace(font_config, size=size)
+        return font
+    
     def draw_milestone(
         self,
         ml: MilestoneLayout,
@@ -112,11 +131,7 @@ class InfographicRenderer(BaseRenderer):
         milestone = ml.milestone
         
         # Get color
-        if milestone.color:
-            color = milestone.color
-        else:
-            idx = self.config.milestones.index(milestone)
-            color = self.theme.colors.get_accent(idx)
+        color = self._milestone_color(milestone)
         
         cx = ml.marker_pos.center_x
         cy = ml.marker_pos.center_y
@@ -124,12 +139,25 @@ class InfographicRenderer(BaseRenderer):
         
         # Outer glow/ring
         if self.theme.use_shadows:
-            for i in range(3):
-                glow_radius = radius + 10 + i * 8
-                r, g, b, _ = self.theme.hex_to_rgba(color)
-                self.ctx.arc(cx, cy, glow_radius, 0, 2 * math.pi)
-                self.ctx.set_source_rgba(r, g, b, 0.1 * opacity * (3 - i) / 3)
-                self.ctx.fill()
+            r, g, b = self.theme.hex_to_rgb(color)
+            glow_radii = [radius + 10 + i * 8 for i in range(3)]
+            outer = glow_radii[-1]
+            
+            # Three stacked rings of fading alpha, filled once: hard gradient
+            # stops give each band the alpha of the rings that overlap it
+            glow = cairo.RadialGradient(cx, cy, 0, cx, cy, outer)
+            inner = 0.0
+            for i, glow_radius in enumerate(glow_radii):
+                transparency = 1.0
+                for j in range(i, 3):
+                    transparency *= 1 - 0.1 * opacity * (3 - j) / 3
+                glow.add_color_stop_rgba(inner / outer, r, g, b, 1 - transparency)
+                glow.add_color_stop_rgba(glow_radius / outer, r, g, b, 1 - transparency)
+                inner = glow_radius
+            
+            self.ctx.arc(cx, cy, outer, 0, 2 * math.pi)
+            self.ctx.set_source(glow)
+            self.ctx.fill()
         
         # Main circle
         self.draw_circle(
@@ -154,26 +182,19 @@ class InfographicRenderer(BaseRenderer):
             # Smaller font for longer text
             base_font = self.theme.label_font if len(badge_text) > 3 else self.theme.title_font
         else:
-            idx = self.config.milestones.index(milestone) + 1
+            idx = self._milestone_index(milestone) + 1
             badge_text = str(idx)
             base_font = self.theme.title_font
         
         # Apply custom badge font size if configured
         badge_font = base_font
         if self.config.fonts and self.config.fonts.badge:
-            from ..themes.base import FontConfig as ThemeFontConfig
-            badge_font = ThemeFontConfig(
-                family=base_font.family,
-                size=self.config.fonts.badge,
-                bold=base_font.bold,
-                italic=base_font.italic,
-            )
+            badge_font = self._resized_font(base_font, self.config.fonts.badge)
         
-        self.theme.apply_font(self.ctx, badge_font)
-        extents = self.ctx.text_extents(badge_text)
+        self._apply_font(badge_font)
+        extents = self._text_extents(badge_text, badge_font)
         
-        r, g, b, _ = self.theme.hex_to_rgba(color)
-        self.ctx.set_source_rgba(r, g, b, opacity)
+        self._set_source(color, opacity)
         self.ctx.move_to(
             cx - extents.width / 2,
             cy + extents.height / 3,
@@ -183,13 +204,7 @@ class InfographicRenderer(BaseRenderer):
         # Title below - apply custom title font size if configured
         title_font = self.theme.label_font
         if self.config.fonts and self.config.fonts.title:
-            from ..themes.base import FontConfig as ThemeFontConfig
-            title_font = ThemeFontConfig(
-                family=self.theme.label_font.family,
-                size=self.config.fonts.title,
-                bold=self.theme.label_font.bold,
-                italic=self.theme.label_font.italic,
-            )
+            title_font = self._resized_font(title_font, self.config.fonts.title)
         
         self.draw_text(
             milestone.title,
@@ -203,7 +218,7 @@ class InfographicRenderer(BaseRenderer):
         
         # Date (skip if transparent - user likely has month in title already)
         if not self.config.output.transparent:
-            date_str = milestone.date.strftime("%b %d, %Y")
+            date_str = self._date_label(milestone.date, "%b %d, %Y")
             self.draw_text(
                 date_str,
                 ml.label_pos.x, ml.label_pos.y + self.theme.label_font.size + 5,
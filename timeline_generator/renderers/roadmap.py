@@ -1,7 +1,6 @@
 """Roadmap style renderer."""
 
 from ..core.layout import LayoutEngine, TimelineLayout, MilestoneLayout
-from ..core.scale import date_to_position
 from .base import BaseRenderer
 
 
@@ -34,21 +33,17 @@ class RoadmapRenderer(BaseRenderer):
         # Time period labels
         chart_width = x2 - x1
         
-        for i, (tick, label) in enumerate(zip(
-            self.scale_info.major_ticks,
-            self.scale_info.unit_labels,
-        )):
-            x = date_to_position(tick, self.scale_info, chart_width) + x1
-            
-            # Separator line
-            if i > 0:
-                self.draw_line(
-                    x, y1 + 5,
-                    x, y2 - 5,
-                    self.theme.colors.primary_light,
-                    1,
-                )
-            
+        labels = self.scale_info.unit_labels
+        xs = self._tick_positions(chart_width, x1)[:len(labels)]
+        
+        # Separator lines between periods (one stroke for all of them)
+        self.draw_lines(
+            [(x, y1 + 5, x, y2 - 5) for x in xs[1:]],
+            self.theme.colors.primary_light,
+            1,
+        )
+        
+        for x, label in zip(xs, labels):
             # Label
             self.draw_text(
                 label,
@@ -65,18 +60,16 @@ class RoadmapRenderer(BaseRenderer):
         lanes_height = self.height - lanes_top - self.theme.margin
         lane_height = lanes_height / max(1, len(categories))
         
+        # Alternating lane backgrounds (lanes don't overlap, so one fill)
+        lane_width = self.width - 2 * self.theme.margin
+        for i in range(0, len(categories), 2):
+            self.ctx.rectangle(self.theme.margin, lanes_top + i * lane_height, lane_width, lane_height)
+        self._set_source(self.theme.colors.background_alt)
+        self.ctx.fill()
+        
         for i, cat in enumerate(categories):
             lane_y = lanes_top + i * lane_height
             
-            # Lane background (alternating)
-            if i % 2 == 0:
-                self.draw_rounded_rect(
-                    self.theme.margin, lane_y,
-                    self.width - 2 * self.theme.margin, lane_height,
-                    0,
-                    self.theme.colors.background_alt,
-                )
-            
             # Lane label
             self.draw_rounded_rect(
                 self.theme.margin, lane_y + 5,
@@ -99,17 +92,10 @@ class RoadmapRenderer(BaseRenderer):
         x2, y2 = layout.axis_end
         chart_width = x2 - x1
         
-        # Draw grid lines extending to the bottom
-        for tick in self.scale_info.major_ticks:
-            x = date_to_position(tick, self.scale_info, chart_width) + x1
-            
-            self.draw_line(
-                x, y2,
-                x, self.height - self.theme.margin,
-                self.theme.colors.border,
-                0.5,
-                dashed=True,
-            )
+        # Draw grid lines extending to the bottom (one stroke for all of them)
+        bottom = self.height - self.theme.margin
+        grid = [(x, y2, x, bottom) for x in self._tick_positions(chart_width, x1)]
+        self.draw_lines(grid, self.theme.colors.border, 0.5, dashed=True)
     
     def draw_milestone(
         self,
@@ -121,11 +107,7 @@ class RoadmapRenderer(BaseRenderer):
         milestone = ml.milestone
         
         # Get color
-        if milestone.color:
-            color = milestone.color
-        else:
-            idx = self.config.milestones.index(milestone)
-            color = self.theme.colors.get_accent(idx)
+        color = self._milestone_color(milestone)
         
         # Draw card
         card = ml.marker_pos
@@ -152,20 +134,15 @@ class RoadmapRenderer(BaseRenderer):
             opacity=opacity,
         )
         
-        # Color bar at top
+        # Color bar at top (rounded to match the card, square underneath)
         bar_height = 6
-        self.draw_rounded_rect(
+        self.draw_top_rounded_rect(
             card.x, card.y,
             card.width, bar_height + self.theme.corner_radius,
             self.theme.corner_radius,
             color,
             opacity=opacity,
         )
-        # Cover bottom corners of the color bar
-        self.ctx.rectangle(card.x, card.y + bar_height, card.width, self.theme.corner_radius)
-        r, g, b, _ = self.theme.hex_to_rgba(color)
-        self.ctx.set_source_rgba(r, g, b, opacity)
-        self.ctx.fill()
         
         # Title
         self.draw_text(
@@ -178,7 +155,7 @@ class RoadmapRenderer(BaseRenderer):
         )
         
         # Date
-        date_str = milestone.date.strftime("%b %d, %Y")
+        date_str = self._date_label(milestone.date, "%b %d, %Y")
         self.draw_text(
             date_str,
             card.x + 10, card.y + bar_height + 32,
@@ -1,7 +1,6 @@
 """Vertical timeline renderer."""
 
 from ..core.layout import LayoutEngine, TimelineLayout, MilestoneLayout
-from ..core.scale import date_to_position
 from .base import BaseRenderer
 
 
@@ -30,15 +29,12 @@ class VerticalRenderer(BaseRenderer):
             self.theme.line_width,
         )
         
-        # Arrow head at bottom
+        # Arrow head at bottom (draw_line left the primary color as source)
         arrow_size = 12
         self.ctx.move_to(x2, y2)
         self.ctx.line_to(x2 - arrow_size / 2, y2 - arrow_size)
         self.ctx.line_to(x2 + arrow_size / 2, y2 - arrow_size)
         self.ctx.close_path()
-        
-        r, g, b, _ = self.theme.hex_to_rgba(self.theme.colors.primary)
-        self.ctx.set_source_rgba(r, g, b, 1)
         self.ctx.fill()
     
     def draw_scale_markers(self, layout: TimelineLayout) -> None:
@@ -47,21 +43,12 @@ class VerticalRenderer(BaseRenderer):
         _, y2 = layout.axis_end
         timeline_height = y2 - y1
         
-        # Draw major ticks
-        for tick, label in zip(
-            self.scale_info.major_ticks,
-            self.scale_info.unit_labels,
-        ):
-            y = date_to_position(tick, self.scale_info, timeline_height) + y1
-            
-            # Tick mark
-            tick_width = 10
-            self.draw_line(
-                x1 - tick_width / 2, y,
-                x1 + tick_width / 2, y,
-                self.theme.colors.primary,
-                self.theme.connector_width,
-            )
+        # Draw major ticks (one stroke for all of them)
+        tick_width = 10
+        ticks = []
+        for y in self._tick_positions(timeline_height, y1)[:len(self.scale_info.unit_labels)]:
+            ticks.append((x1 - tick_width / 2, y, x1 + tick_width / 2, y))
+        self.draw_lines(ticks, self.theme.colors.primary, self.theme.connector_width)
     
     def draw_milestone(
         self,
@@ -73,11 +60,7 @@ class VerticalRenderer(BaseRenderer):
         milestone = ml.milestone
         
         # Get color
-        if milestone.color:
-            color = milestone.color
-        else:
-            idx = self.config.milestones.index(milestone)
-            color = self.theme.colors.get_accent(idx)
+        color = self._milestone_color(milestone)
         
         is_left = ml.is_above  # Reused for left/right
         
@@ -135,7 +118,7 @@ class VerticalRenderer(BaseRenderer):
         )
         
         # Draw date badge
-        date_str = milestone.date.strftime("%b %d")
+        date_str = self._date_label(milestone.date, "%b %d")
         badge_width = 60
         badge_height = 24
         
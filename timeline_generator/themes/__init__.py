@@ -1,17 +1,47 @@
 """Theme system for timeline styling."""
 
+import functools
+import importlib
+
 from .base import Theme
-from .minimal import MinimalTheme
-from .corporate import CorporateTheme
-from .creative import CreativeTheme
-from .dark import DarkTheme
-
-THEMES = {
-    "minimal": MinimalTheme,
-    "corporate": CorporateTheme,
-    "creative": CreativeTheme,
-    "dark": DarkTheme,
+
+# Theme name -> (module, class); theme modules are imported on first use
+_THEMES = {
+    "minimal": (".minimal", "MinimalTheme"),
+    "corporate": (".corporate", "CorporateTheme"),
+    "creative": (".creative", "CreativeTheme"),
+    "dark": (".dark", "DarkTheme"),
 }
+_CLASS_THEMES = {class_name: name for name, (_, class_name) in _THEMES.items()}
+
+THEME_NAMES = tuple(_THEMES)
+
+
+@functools.lru_cache(maxsize=None)
+def get_theme_class(name: str) -> type:
+    """
+    Import and return the theme class for a theme name.
+    
+    Args:
+        name: Theme name (``ThemeName`` value); unknown names fall back to
+            the minimal theme
+        
+    Returns:
+        Theme subclass
+    """
+    module_name, class_name = _THEMES.get(name, _THEMES["minimal"])
+    return getattr(importlib.import_module(module_name, __name__), class_name)
+
+
+def __getattr__(name: str):
+    """Resolve theme class names and the ``THEMES`` mapping lazily."""
+    if name in _CLASS_THEMES:
+        return get_theme_class(_CLASS_THEMES[name])
+    if name == "THEMES":
+        # Name -> class for every theme; imports all of them
+        return {theme: get_theme_class(theme) for theme in _THEMES}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Theme",
@@ -20,5 +50,6 @@ __all__ = [
     "CreativeTheme",
     "DarkTheme",
     "THEMES",
+    "THEME_NAMES",
+    "get_theme_class",
 ]
-
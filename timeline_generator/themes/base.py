@@ -1,12 +1,66 @@
 """Base theme class defining the theme interface."""
 
-from dataclasses import dataclass, field
-from typing import Optional
+import functools
+import re
+from dataclasses import dataclass, field, replace
+from typing import ClassVar, Optional
 
 
-@dataclass
+_RGBA_RE = re.compile(r"rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_rgb(color: str) -> tuple[float, float, float, Optional[float]]:
+    """
+    Parse a ``#RRGGBB`` or ``rgba(...)`` string (memoized; themes reuse a few colors).
+    
+    Cached independently of the caller's alpha, so fading a color through
+    every animation frame's opacity reuses a single entry.
+    
+    Returns:
+        Red, green and blue in the 0-1 range, plus the string's own alpha
+        for ``rgba(...)`` colors (None otherwise).
+    """
+    if color.startswith("rgba"):
+        match = _RGBA_RE.match(color)
+        if match:
+            r, g, b, a = match.groups()
+            return int(r) / 255, int(g) / 255, int(b) / 255, float(a)
+    
+    hex_color = color.lstrip("#")
+    if len(hex_color) == 6:
+        value = int(hex_color, 16)
+        return (value >> 16) / 255, ((value >> 8) & 0xFF) / 255, (value & 0xFF) / 255, None
+    return 0, 0, 0, None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_opaque_rgb(color: str) -> tuple[float, float, float]:
+    """Parse a color to its red, green and blue channels only (memoized)."""
+    r, g, b, _ = _parse_rgb(color)
+    return r, g, b
+
+
+# Default milestone accents; a tuple, so every palette can share it
+_DEFAULT_ACCENTS = (
+    "#E91E63",  # Pink
+    "#9C27B0",  # Purple
+    "#673AB7",  # Deep Purple
+    "#3F51B5",  # Indigo
+    "#2196F3",  # Blue
+    "#00BCD4",  # Cyan
+    "#009688",  # Teal
+    "#4CAF50",  # Green
+    "#8BC34A",  # Light Green
+    "#CDDC39",  # Lime
+    "#FFC107",  # Amber
+    "#FF9800",  # Orange
+)
+
+
+@dataclass(frozen=True, slots=True)
 class FontConfig:
-    """Font configuration."""
+    """Font configuration (immutable, so themes share instances)."""
     
     family: str = "Sans"
     size: float = 14.0
@@ -14,7 +68,7 @@ class FontConfig:
     italic: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorPalette:
     """Color palette for a theme."""
     
@@ -49,52 +103,29 @@ class ColorPalette:
     shadow: str = "rgba(0, 0, 0, 0.1)"
     
     # Accent colors for milestones
-    accents: list[str] = field(default_factory=lambda: [
-        "#E91E63",  # Pink
-        "#9C27B0",  # Purple
-        "#673AB7",  # Deep Purple
-        "#3F51B5",  # Indigo
-        "#2196F3",  # Blue
-        "#00BCD4",  # Cyan
-        "#009688",  # Teal
-        "#4CAF50",  # Green
-        "#8BC34A",  # Light Green
-        "#CDDC39",  # Lime
-        "#FFC107",  # Amber
-        "#FF9800",  # Orange
-    ])
+    accents: tuple[str, ...] = _DEFAULT_ACCENTS
     
     def get_accent(self, index: int) -> str:
         """Get an accent color by index (cycles through available accents)."""
         return self.accents[index % len(self.accents)]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Theme:
     """Base theme configuration."""
     
-    name: str = "base"
-    display_name: str = "Base Theme"
+    name: ClassVar[str] = "base"
+    display_name: ClassVar[str] = "Base Theme"
     
     # Colors
     colors: ColorPalette = field(default_factory=ColorPalette)
     
     # Typography
-    title_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Sans", size=32.0, bold=True
-    ))
-    subtitle_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Sans", size=18.0, italic=True
-    ))
-    label_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Sans", size=14.0, bold=True
-    ))
-    description_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Sans", size=12.0
-    ))
-    date_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Sans", size=11.0
-    ))
+    title_font: FontConfig = FontConfig(family="Sans", size=32.0, bold=True)
+    subtitle_font: FontConfig = FontConfig(family="Sans", size=18.0, italic=True)
+    label_font: FontConfig = FontConfig(family="Sans", size=14.0, bold=True)
+    description_font: FontConfig = FontConfig(family="Sans", size=12.0)
+    date_font: FontConfig = FontConfig(family="Sans", size=11.0)
     
     # Shapes and sizes
     marker_radius: float = 8.0
@@ -118,21 +149,12 @@ class Theme:
     
     def hex_to_rgba(self, hex_color: str, alpha: float = 1.0) -> tuple[float, float, float, float]:
         """Convert hex color to RGBA tuple (0-1 range for Cairo)."""
-        if hex_color.startswith("rgba"):
-            # Parse rgba string
-            import re
-            match = re.match(r"rgba\((\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\)", hex_color)
-            if match:
-                r, g, b, a = match.groups()
-                return int(r) / 255, int(g) / 255, int(b) / 255, float(a)
-        
-        hex_color = hex_color.lstrip("#")
-        if len(hex_color) == 6:
-            r = int(hex_color[0:2], 16) / 255
-            g = int(hex_color[2:4], 16) / 255
-            b = int(hex_color[4:6], 16) / 255
-            return r, g, b, alpha
-        return 0, 0, 0, alpha
+        r, g, b, a = _parse_rgb(hex_color)
+        return r, g, b, alpha if a is None else a
+    
+    def hex_to_rgb(self, hex_color: str) -> tuple[float, float, float]:
+        """Convert a color to an RGB tuple (0-1 range for Cairo), ignoring alpha."""
+        return _parse_opaque_rgb(hex_color)
     
     def apply_font(self, ctx, font_config: FontConfig) -> None:
         """Apply font configuration to Cairo context."""
@@ -144,6 +166,22 @@ class Theme:
         ctx.select_font_face(font_config.family, slant, weight)
         ctx.set_font_size(font_config.size)
     
+    def with_color_overrides(self, color_config) -> "Theme":
+        """Return a copy of this theme with custom color overrides applied.
+        
+        Only the color palette is copied; fonts and other settings are shared
+        with this theme, which is left untouched.
+        
+        Args:
+            color_config: ColorConfig object with optional color overrides.
+        """
+        if color_config is None:
+            return self
+        
+        theme = replace(self, colors=replace(self.colors))
+        theme.apply_color_overrides(color_config)
+        return theme
+    
     def apply_color_overrides(self, color_config) -> None:
         """Apply custom color overrides from config.
         
@@ -1,16 +1,17 @@
 """Corporate theme - professional and business-focused."""
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from .base import Theme, ColorPalette, FontConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CorporateTheme(Theme):
     """Professional corporate theme with blue tones."""
     
-    name: str = "corporate"
-    display_name: str = "Corporate"
+    name: ClassVar[str] = "corporate"
+    display_name: ClassVar[str] = "Corporate"
     
     colors: ColorPalette = field(default_factory=lambda: ColorPalette(
         background="#FFFFFF",
@@ -31,7 +32,7 @@ class CorporateTheme(Theme):
         border="#CBD5E0",
         divider="#A0AEC0",
         shadow="rgba(30, 58, 95, 0.15)",
-        accents=[
+        accents=(
             "#1E3A5F",  # Navy
             "#4A90D9",  # Corporate Blue
             "#2E7D32",  # Forest Green
@@ -40,24 +41,14 @@ class CorporateTheme(Theme):
             "#B45309",  # Bronze
             "#BE185D",  # Magenta
             "#059669",  # Emerald
-        ],
+        ),
     ))
     
-    title_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Georgia", size=34.0, bold=True
-    ))
-    subtitle_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Georgia", size=18.0, italic=True
-    ))
-    label_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Arial", size=14.0, bold=True
-    ))
-    description_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Arial", size=12.0
-    ))
-    date_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Arial", size=11.0
-    ))
+    title_font: FontConfig = FontConfig(family="Georgia", size=34.0, bold=True)
+    subtitle_font: FontConfig = FontConfig(family="Georgia", size=18.0, italic=True)
+    label_font: FontConfig = FontConfig(family="Arial", size=14.0, bold=True)
+    description_font: FontConfig = FontConfig(family="Arial", size=12.0)
+    date_font: FontConfig = FontConfig(family="Arial", size=11.0)
     
     marker_radius: float = 10.0
     marker_border_width: float = 2.5
@@ -1,16 +1,17 @@
 """Creative theme - bold colors and playful design."""
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from .base import Theme, ColorPalette, FontConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreativeTheme(Theme):
     """Bold, creative theme with vibrant colors."""
     
-    name: str = "creative"
-    display_name: str = "Creative"
+    name: ClassVar[str] = "creative"
+    display_name: ClassVar[str] = "Creative"
     
     colors: ColorPalette = field(default_factory=lambda: ColorPalette(
         background="#FFF8E7",
@@ -31,7 +32,7 @@ class CreativeTheme(Theme):
         border="#D5DBDB",
         divider="#AEB6BF",
         shadow="rgba(255, 107, 107, 0.2)",
-        accents=[
+        accents=(
             "#FF6B6B",  # Coral
             "#4ECDC4",  # Turquoise
             "#FFE66D",  # Yellow
@@ -44,24 +45,14 @@ class CreativeTheme(Theme):
             "#77DD77",  # Pastel Green
             "#FF85A2",  # Rose
             "#89CFF0",  # Baby Blue
-        ],
+        ),
     ))
     
-    title_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Comic Sans MS", size=38.0, bold=True
-    ))
-    subtitle_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Arial", size=18.0, italic=True
-    ))
-    label_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Arial", size=15.0, bold=True
-    ))
-    description_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Arial", size=13.0
-    ))
-    date_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Arial", size=12.0, bold=True
-    ))
+    title_font: FontConfig = FontConfig(family="Comic Sans MS", size=38.0, bold=True)
+    subtitle_font: FontConfig = FontConfig(family="Arial", size=18.0, italic=True)
+    label_font: FontConfig = FontConfig(family="Arial", size=15.0, bold=True)
+    description_font: FontConfig = FontConfig(family="Arial", size=13.0)
+    date_font: FontConfig = FontConfig(family="Arial", size=12.0, bold=True)
     
     marker_radius: float = 14.0
     marker_border_width: float = 3.0
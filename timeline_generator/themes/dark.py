@@ -1,16 +1,17 @@
 """Dark theme - modern dark mode design."""
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from .base import Theme, ColorPalette, FontConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DarkTheme(Theme):
     """Modern dark theme with neon accents."""
     
-    name: str = "dark"
-    display_name: str = "Dark"
+    name: ClassVar[str] = "dark"
+    display_name: ClassVar[str] = "Dark"
     
     colors: ColorPalette = field(default_factory=lambda: ColorPalette(
         background="#0D1117",
@@ -31,7 +32,7 @@ class DarkTheme(Theme):
         border="#30363D",
         divider="#21262D",
         shadow="rgba(0, 0, 0, 0.4)",
-        accents=[
+        accents=(
             "#58A6FF",  # Blue
             "#F78166",  # Orange
             "#3FB950",  # Green
@@ -44,24 +45,14 @@ class DarkTheme(Theme):
             "#FF7B72",  # Red
             "#56D4DD",  # Cyan
             "#FFDCD7",  # Peach
-        ],
+        ),
     ))
     
-    title_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Menlo", size=32.0, bold=True
-    ))
-    subtitle_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Menlo", size=16.0, italic=False
-    ))
-    label_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Menlo", size=13.0, bold=True
-    ))
-    description_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Menlo", size=11.0
-    ))
-    date_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Menlo", size=10.0
-    ))
+    title_font: FontConfig = FontConfig(family="Menlo", size=32.0, bold=True)
+    subtitle_font: FontConfig = FontConfig(family="Menlo", size=16.0, italic=False)
+    label_font: FontConfig = FontConfig(family="Menlo", size=13.0, bold=True)
+    description_font: FontConfig = FontConfig(family="Menlo", size=11.0)
+    date_font: FontConfig = FontConfig(family="Menlo", size=10.0)
     
     marker_radius: float = 8.0
     marker_border_width: float = 2.0
@@ -1,16 +1,17 @@
 """Minimal theme - clean and simple."""
 
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from .base import Theme, ColorPalette, FontConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MinimalTheme(Theme):
     """Clean, minimal theme with subtle colors and clean lines."""
     
-    name: str = "minimal"
-    display_name: str = "Minimal"
+    name: ClassVar[str] = "minimal"
+    display_name: ClassVar[str] = "Minimal"
     
     colors: ColorPalette = field(default_factory=lambda: ColorPalette(
         background="#FFFFFF",
@@ -31,7 +32,7 @@ class MinimalTheme(Theme):
         border="#E8E8E8",
         divider="#D0D0D0",
         shadow="rgba(0, 0, 0, 0.05)",
-        accents=[
+        accents=(
             "#333333",
             "#555555",
             "#777777",
@@ -40,24 +41,14 @@ class MinimalTheme(Theme):
             "#444444",
             "#666666",
             "#888888",
-        ],
+        ),
     ))
     
-    title_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Helvetica", size=28.0, bold=False
-    ))
-    subtitle_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Helvetica", size=16.0, italic=False
-    ))
-    label_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Helvetica", size=13.0, bold=False
-    ))
-    description_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Helvetica", size=11.0
-    ))
-    date_font: FontConfig = field(default_factory=lambda: FontConfig(
-        family="Helvetica", size=10.0
-    ))
+    title_font: FontConfig = FontConfig(family="Helvetica", size=28.0, bold=False)
+    subtitle_font: FontConfig = FontConfig(family="Helvetica", size=16.0, italic=False)
+    label_font: FontConfig = FontConfig(family="Helvetica", size=13.0, bold=False)
+    description_font: FontConfig = FontConfig(family="Helvetica", size=11.0)
+    date_font: FontConfig = FontConfig(family="Helvetica", size=10.0)
     
     marker_radius: float = 6.0
     marker_border_width: float = 1.5